@@ -1,4 +1,4 @@
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator
 from time import monotonic_ns, sleep
 from typing import Protocol
 
@@ -7,16 +7,37 @@ class Tickable(Protocol):
     def tick(self) -> None: ...
 
 
-def clock(tickable: Tickable, hz: int, /) -> Iterator[None]:
-    time_clock = 1_000_000_000 / hz
-    last = 0
+def clock(tickable: Tickable, hz: int, /, *, batch: int = 1) -> Iterator[None]:
+    time_clock = 1_000_000_000 * batch // hz
+    target = monotonic_ns()
     while True:
-        now = monotonic_ns()
-        time = last + time_clock - now
+        target += time_clock
+        time = target - monotonic_ns()
         if time > 0:
             sleep(time / 1_000_000_000)
-            now = monotonic_ns()
-        last = now
+        elif time < -time_clock:
+            target = monotonic_ns()
 
-        tickable.tick()
-        yield
+        for _ in range(batch):
+            tickable.tick()
+            yield
+
+
+def run_clock(tickable: Tickable, hz: int, on_tick: Callable[[], bool], /, *, batch: int = 1) -> None:
+    time_clock = 1_000_000_000 * batch // hz
+    tick = tickable.tick
+    target = monotonic_ns()
+    running = True
+    while running:
+        target += time_clock
+        time = target - monotonic_ns()
+        if time > 0:
+            sleep(time / 1_000_000_000)
+        elif time < -time_clock:
+            target = monotonic_ns()
+
+        for _ in range(batch):
+            tick()
+            if not on_tick():
+                running = False
+                break
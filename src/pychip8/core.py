@@ -1,16 +1,31 @@
 from collections.abc import Callable
-from secrets import randbits
-from typing import TYPE_CHECKING
+from random import getrandbits
+from typing import ClassVar
 
 from .devices.devicebus import DeviceBus
 from .devices.display import Display
-from .devices.keyboard import Key, Keyboard
-
-if TYPE_CHECKING:
-    from asyncio import Future
+from .devices.keyboard import Keyboard
 
 
 class Chip8Core:
+    __slots__ = (
+        '__dict__',
+        '_bus',
+        '_display',
+        '_keyboard',
+        '_v',
+        '_i',
+        '_sp',
+        '_pc',
+        '_delay_timer',
+        '_sound_timer',
+        '_decoded',
+        '_instructions_per_update',
+        '_instructions_executable',
+        '_tick_callback',
+        '_update_callback',
+    )
+
     def __init__(
         self,
         *,
@@ -24,13 +39,14 @@ class Chip8Core:
         self._bus = bus
         self._display = display
         self._keyboard = keyboard
-        self._v = [0 for _ in range(16)]
+        self._v = bytearray(16)
         self._i = 0
         self._sp = len(bus) - reserved_address - 2
         self._pc = entrypoint
         self._delay_timer = 0
         self._sound_timer = 0
-        self._waiting_keyboard: Future[Key] | None = None
+        self._decoded: list[Callable[[], None] | None] = [None] * len(bus)
+        bus.add_write_callback(self._invalidate_decoded)
         self._instructions_per_update = instructions_per_update
         self._instructions_executable = 0
         self._tick_callback: Callable[[], None] | None = None
@@ -57,93 +73,187 @@ class Chip8Core:
                 self._update_callback()
 
     def _decrement_timer(self) -> None:
-        if self._delay_timer:
-            self._delay_timer -= 1
-        if self._sound_timer:
-            self._sound_timer -= 1
-
-    def _execute_instruction(self) -> None:  # noqa: C901, PLR0912, PLR0915
-        instruction = (self._bus[self._pc] << 8) | (self._bus[self._pc + 1])
-        op = (instruction >> 12) & 0xF
+        delay = self._delay_timer
+        sound = self._sound_timer
+        self._delay_timer = delay - (delay > 0)
+        self._sound_timer = sound - (sound > 0)
+
+    def _invalidate_decoded(self, address: int, /) -> None:
+        decoded = self._decoded
+        if 0 <= address < len(decoded):
+            decoded[address] = None
+        if 0 <= address - 1 < len(decoded):
+            decoded[address - 1] = None
+
+    def _decode(self, pc: int, /) -> Callable[[], None]:
+        instruction = (self._bus[pc] << 8) | (self._bus[pc + 1])
+        return self._COMPILE[instruction >> 12](self, instruction)
+
+    def _execute_instruction(self) -> None:
+        pc = self._pc
+        decoded = self._decoded
+        if pc < len(decoded):
+            fn = decoded[pc]
+            if fn is None:
+                fn = self._decode(pc)
+                decoded[pc] = fn
+        else:
+            fn = self._decode(pc)
+        self._pc = pc + 2
+        fn()
+
+    def _compile_op0(self, instruction: int, /) -> Callable[[], None]:
+        if instruction == 0x00E0:
+            return self._instruction_cls
+        if instruction == 0x00EE:
+            return self._instruction_rts
+        handler = self._instruction_sys
         nnn = instruction & 0xFFF
-        nn = instruction & 0xFF
-        n = instruction & 0xF
+        return lambda: handler(nnn)
+
+    def _compile_op5(self, instruction: int, /) -> Callable[[], None]:
+        if instruction & 0xF:
+            raise RuntimeError('Undefined instruction')
         x = (instruction >> 8) & 0xF
         y = (instruction >> 4) & 0xF
-        self._pc += 2
+        handler = self._instruction_skip_eq_register
+        return lambda: handler(x, y)
 
-        if instruction == 0x00E0:
-            self._instruction_cls()
-        elif instruction == 0x00EE:
-            self._instruction_rts()
-        elif op == 0:
-            self._instruction_sys(nnn)
-        elif op == 1:
-            self._instruction_jump(nnn)
-        elif op == 2:
-            self._instruction_call(nnn)
-        elif op == 3:
-            self._instruction_skip_eq_imediate(x, nn)
-        elif op == 4:
-            self._instruction_skip_ne_imediate(x, nn)
-        elif op == 5 and n == 0:
-            self._instruction_skip_eq_register(x, y)
-        elif op == 6:
-            self._instruction_mov_imediate(x, nn)
-        elif op == 7:
-            self._instruction_add_imediate(x, nn)
-        elif op == 8 and n == 0:
-            self._instruction_mov_register(x, y)
-        elif op == 8 and n == 1:
-            self._instruction_or(x, y)
-        elif op == 8 and n == 2:
-            self._instruction_and(x, y)
-        elif op == 8 and n == 3:
-            self._instruction_xor(x, y)
-        elif op == 8 and n == 4:
-            self._instruction_add_register(x, y)
-        elif op == 8 and n == 5:
-            self._instruction_sub(x, y)
-        elif op == 8 and n == 6:
-            self._instruction_shr(x, y)
-        elif op == 8 and n == 7:
-            self._instruction_subb(x, y)
-        elif op == 8 and n == 0xE:
-            self._instruction_shl(x, y)
-        elif op == 9 and n == 0:
-            self._instruction_skip_ne_register(x, y)
-        elif op == 0xA:
-            self._instruction_mov_to_i(nnn)
-        elif op == 0xB:
-            self._instruction_jump_v0(nnn)
-        elif op == 0xC:
-            self._instruction_rnd(x, nn)
-        elif op == 0xD:
-            self._instruction_sprite(x, y, n)
-        elif op == 0xE and nn == 0x9E:
-            self._instruction_skip_key(x)
-        elif op == 0xE and nn == 0xA1:
-            self._instruction_skip_nokey(x)
-        elif op == 0xF and nn == 0x07:
-            self._instruction_mov_from_delay(x)
-        elif op == 0xF and nn == 0x0A:
-            self._instruction_wait_key(x)
-        elif op == 0xF and nn == 0x15:
-            self._instruction_mov_to_delay(x)
-        elif op == 0xF and nn == 0x18:
-            self._instruction_mov_to_sound(x)
-        elif op == 0xF and nn == 0x1E:
-            self._instruction_add_to_i(x)
-        elif op == 0xF and nn == 0x29:
-            self._instruction_spritechar(x)
-        elif op == 0xF and nn == 0x33:
-            self._instruction_movbcd(x)
-        elif op == 0xF and nn == 0x55:
-            self._instruction_movm_to_i(x)
-        elif op == 0xF and nn == 0x65:
-            self._instruction_movm_from_i(x)
-        else:
+    def _compile_op8(self, instruction: int, /) -> Callable[[], None]:
+        name = self._DISPATCH_8.get(instruction & 0xF)
+        if name is None:
+            raise RuntimeError('Undefined instruction')
+        handler = getattr(self, name)
+        x = (instruction >> 8) & 0xF
+        y = (instruction >> 4) & 0xF
+        return lambda: handler(x, y)
+
+    def _compile_op9(self, instruction: int, /) -> Callable[[], None]:
+        if instruction & 0xF:
+            raise RuntimeError('Undefined instruction')
+        x = (instruction >> 8) & 0xF
+        y = (instruction >> 4) & 0xF
+        handler = self._instruction_skip_ne_register
+        return lambda: handler(x, y)
+
+    def _compile_opd(self, instruction: int, /) -> Callable[[], None]:
+        handler = self._instruction_sprite
+        x = (instruction >> 8) & 0xF
+        y = (instruction >> 4) & 0xF
+        n = instruction & 0xF
+        return lambda: handler(x, y, n)
+
+    def _compile_ope(self, instruction: int, /) -> Callable[[], None]:
+        name = self._DISPATCH_E.get(instruction & 0xFF)
+        if name is None:
+            raise RuntimeError('Undefined instruction')
+        handler = getattr(self, name)
+        x = (instruction >> 8) & 0xF
+        return lambda: handler(x)
+
+    def _compile_opf(self, instruction: int, /) -> Callable[[], None]:
+        name = self._DISPATCH_F.get(instruction & 0xFF)
+        if name is None:
             raise RuntimeError('Undefined instruction')
+        handler = getattr(self, name)
+        x = (instruction >> 8) & 0xF
+        return lambda: handler(x)
+
+    _DISPATCH_8: ClassVar[dict[int, str]] = {
+        0x0: '_instruction_mov_register',
+        0x1: '_instruction_or',
+        0x2: '_instruction_and',
+        0x3: '_instruction_xor',
+        0x4: '_instruction_add_register',
+        0x5: '_instruction_sub',
+        0x6: '_instruction_shr',
+        0x7: '_instruction_subb',
+        0xE: '_instruction_shl',
+    }
+    _DISPATCH_E: ClassVar[dict[int, str]] = {
+        0x9E: '_instruction_skip_key',
+        0xA1: '_instruction_skip_nokey',
+    }
+    _DISPATCH_F: ClassVar[dict[int, str]] = {
+        0x07: '_instruction_mov_from_delay',
+        0x0A: '_instruction_wait_key',
+        0x15: '_instruction_mov_to_delay',
+        0x18: '_instruction_mov_to_sound',
+        0x1E: '_instruction_add_to_i',
+        0x29: '_instruction_spritechar',
+        0x33: '_instruction_movbcd',
+        0x55: '_instruction_movm_to_i',
+        0x65: '_instruction_movm_from_i',
+    }
+
+    def _compile_op1(self, instruction: int, /) -> Callable[[], None]:
+        handler = self._instruction_jump
+        nnn = instruction & 0xFFF
+        return lambda: handler(nnn)
+
+    def _compile_op2(self, instruction: int, /) -> Callable[[], None]:
+        handler = self._instruction_call
+        nnn = instruction & 0xFFF
+        return lambda: handler(nnn)
+
+    def _compile_op3(self, instruction: int, /) -> Callable[[], None]:
+        handler = self._instruction_skip_eq_imediate
+        x = (instruction >> 8) & 0xF
+        nn = instruction & 0xFF
+        return lambda: handler(x, nn)
+
+    def _compile_op4(self, instruction: int, /) -> Callable[[], None]:
+        handler = self._instruction_skip_ne_imediate
+        x = (instruction >> 8) & 0xF
+        nn = instruction & 0xFF
+        return lambda: handler(x, nn)
+
+    def _compile_op6(self, instruction: int, /) -> Callable[[], None]:
+        handler = self._instruction_mov_imediate
+        x = (instruction >> 8) & 0xF
+        nn = instruction & 0xFF
+        return lambda: handler(x, nn)
+
+    def _compile_op7(self, instruction: int, /) -> Callable[[], None]:
+        handler = self._instruction_add_imediate
+        x = (instruction >> 8) & 0xF
+        nn = instruction & 0xFF
+        return lambda: handler(x, nn)
+
+    def _compile_opa(self, instruction: int, /) -> Callable[[], None]:
+        handler = self._instruction_mov_to_i
+        nnn = instruction & 0xFFF
+        return lambda: handler(nnn)
+
+    def _compile_opb(self, instruction: int, /) -> Callable[[], None]:
+        handler = self._instruction_jump_v0
+        nnn = instruction & 0xFFF
+        return lambda: handler(nnn)
+
+    def _compile_opc(self, instruction: int, /) -> Callable[[], None]:
+        handler = self._instruction_rnd
+        x = (instruction >> 8) & 0xF
+        nn = instruction & 0xFF
+        return lambda: handler(x, nn)
+
+    _COMPILE: ClassVar[tuple[Callable[['Chip8Core', int], Callable[[], None]], ...]] = (
+        _compile_op0,
+        _compile_op1,
+        _compile_op2,
+        _compile_op3,
+        _compile_op4,
+        _compile_op5,
+        _compile_op6,
+        _compile_op7,
+        _compile_op8,
+        _compile_op9,
+        _compile_opa,
+        _compile_opb,
+        _compile_opc,
+        _compile_opd,
+        _compile_ope,
+        _compile_opf,
+    )
 
     def _instruction_sys(self, nnn: int, /) -> None:
         raise NotImplementedError(f'Instruction {nnn:04x} not implemented')
@@ -214,27 +324,31 @@ class Chip8Core:
         self._v[15] = total >> 8
 
     def _instruction_sub(self, x: int, y: int, /) -> None:
-        self._v[15] = int(self._v[x] > self._v[y])
-        self._v[x] = (self._v[x] - self._v[y]) & 0xFF
+        diff = self._v[x] - self._v[y]
+        self._v[15] = -diff >> 8 & 1
+        self._v[x] = diff & 0xFF
 
     def _instruction_subb(self, x: int, y: int, /) -> None:
-        self._v[15] = int(self._v[y] > self._v[x])
-        self._v[x] = (self._v[y] - self._v[x]) & 0xFF
+        diff = self._v[y] - self._v[x]
+        self._v[15] = -diff >> 8 & 1
+        self._v[x] = diff & 0xFF
 
     def _instruction_shr(self, x: int, y: int, /) -> None:
-        self._v[15] = self._v[y] & 1
-        self._v[x] = self._v[y] >> 1
+        vy = self._v[y]
+        self._v[15] = vy & 1
+        self._v[x] = vy >> 1
 
     def _instruction_shl(self, x: int, y: int, /) -> None:
-        self._v[15] = self._v[y] >> 7
-        self._v[x] = (self._v[y] << 1) & 0xFF
+        vy = self._v[y]
+        self._v[15] = vy >> 7
+        self._v[x] = vy << 1 & 0xFF
 
     def _instruction_cls(self) -> None:
         self._display.clear()
 
     def _instruction_sprite(self, x: int, y: int, n: int, /) -> None:
-        sprite = [self._bus[i] for i in range(self._i, self._i + n)]
-        self._v[15] = int(self._display.draw_sprite(self._v[x], self._v[y], sprite))
+        sprite = self._bus.read_bytes(self._i, n)
+        self._v[15] = self._display.draw_sprite(self._v[x], self._v[y], sprite)
 
     def _instruction_spritechar(self, x: int, /) -> None:
         self._i = self._v[x] * 5
@@ -246,21 +360,19 @@ class Chip8Core:
         self._i = (self._i + self._v[x]) & 0xFFF
 
     def _instruction_skip_key(self, x: int, /) -> None:
-        if self._keyboard[Key(self._v[x])]:
+        if self._keyboard[self._v[x]]:
             self._pc += 2
 
     def _instruction_skip_nokey(self, x: int, /) -> None:
-        if not self._keyboard[Key(x)]:
+        if not self._keyboard[x]:
             self._pc += 2
 
     def _instruction_wait_key(self, x: int, /) -> None:
-        if self._waiting_keyboard is None:
-            self._waiting_keyboard = self._keyboard.next_key_pressed()
-        if self._waiting_keyboard.done():
-            self._v[x] = int(self._waiting_keyboard.result())
-            self._waiting_keyboard = None
-        else:
+        key = self._keyboard.first_pressed_key()
+        if key is None:
             self._pc -= 2
+        else:
+            self._v[x] = key
 
     def _instruction_mov_from_delay(self, x: int, /) -> None:
         self._v[x] = self._delay_timer
@@ -272,11 +384,11 @@ class Chip8Core:
         self._sound_timer = self._v[x]
 
     def _instruction_rnd(self, x: int, nn: int, /) -> None:
-        self._v[x] = randbits(8) & nn
+        self._v[x] = getrandbits(8) & nn
+
+    _BCD: ClassVar[tuple[bytes, ...]] = tuple(
+        bytes((value // 100, value // 10 % 10, value % 10)) for value in range(256)
+    )
 
     def _instruction_movbcd(self, x: int, /) -> None:
-        value = self._v[x]
-        self._bus[self._i + 2] = value % 10
-        value //= 10
-        self._bus[self._i + 1] = value % 10
-        self._bus[self._i] = value // 10
+        self._bus.write_bytes(self._i, self._BCD[self._v[x]])
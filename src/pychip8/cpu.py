@@ -10,6 +10,8 @@ from .devices.rom import Rom
 
 
 class Chip8:
+    tick: Callable[[], None]
+
     @classmethod
     def new_cosmac_vip_with_4096_ram(cls, *, instructions_per_update: int = 16) -> 'Chip8':  # pragma: no cover
         bus = DeviceBus()
@@ -46,6 +48,7 @@ class Chip8:
         instructions_per_update: int,
     ) -> None:
         self._cores = cores
+        self._core_ticks = tuple(core.tick for core in cores)
         self._bus = bus
         self._display = display
         self._keyboard = keyboard
@@ -53,6 +56,7 @@ class Chip8:
         self._instructions_executable = 0
         self._tick_callback: Callable[[], None] | None = None
         self._update_callback: Callable[[], None] | None = None
+        self._rebind_tick()
 
     def __repr__(self) -> str:
         return f'Chip8(cores={len(self)})'
@@ -65,13 +69,21 @@ class Chip8:
 
     def set_tick_callback(self, callback: Callable[[], None] | None, /) -> None:
         self._tick_callback = callback
+        self._rebind_tick()
 
     def set_update_callback(self, callback: Callable[[], None] | None, /) -> None:
         self._update_callback = callback
+        self._rebind_tick()
+
+    def _rebind_tick(self) -> None:
+        if len(self._cores) == 1 and self._tick_callback is None and self._update_callback is None:
+            self.tick = self._cores[0].tick
+        else:
+            self.tick = self._tick_cores
 
-    def tick(self) -> None:
-        for core in self._cores:
-            core.tick()
+    def _tick_cores(self) -> None:
+        for tick in self._core_ticks:
+            tick()
         if self._tick_callback:
             self._tick_callback()
         self._instructions_executable += 1
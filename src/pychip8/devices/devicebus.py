@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from typing import BinaryIO, Protocol
 
 
@@ -10,43 +11,89 @@ class Device(Protocol):
 
 
 class DeviceBus:
+    __slots__ = ('_devices', '_table', '_write_callbacks')
+
     def __init__(self) -> None:
         self._devices: list[tuple[int, int, Device]] = []
+        self._table: list[tuple[Device, int] | None] = []
+        self._write_callbacks: list[Callable[[int], None]] = []
 
     def __repr__(self) -> str:
         return f'DeviceBus(devices={len(self._devices)})'
 
     def __len__(self) -> int:
-        return max((end + 1 for _, end, _ in self._devices), default=0)
+        return len(self._table)
 
-    def __getitem__(self, address: int, /) -> int:
+    def _rebuild_table(self) -> None:
+        size = max((end + 1 for _, end, _ in self._devices), default=0)
+        table: list[tuple[Device, int] | None] = [None] * size
         for start, end, device in self._devices:
-            if start <= address <= end:
-                return device[address - start]
-        raise RuntimeError('Device not found for this address')
+            for address in range(start, end + 1):
+                if table[address] is None:
+                    table[address] = (device, start)
+        self._table = table
+
+    def __getitem__(self, address: int, /) -> int:
+        entry = self._table[address] if 0 <= address < len(self._table) else None
+        if entry is None:
+            raise RuntimeError('Device not found for this address')
+        device, start = entry
+        return device[address - start]
 
     def __setitem__(self, address: int, value: int, /) -> None:
-        for start, end, device in self._devices:
-            if start <= address <= end:
-                device[address - start] = value
+        entry = self._table[address] if 0 <= address < len(self._table) else None
+        if entry is None:
+            raise RuntimeError('Device not found for this address')
+        device, start = entry
+        device[address - start] = value
+        for callback in self._write_callbacks:
+            callback(address)
+
+    def read_bytes(self, address: int, length: int, /) -> bytes:
+        entry = self._table[address] if 0 <= address < len(self._table) else None
+        if entry is not None:
+            device, start = entry
+            view = getattr(device, 'view', None)
+            offset = address - start
+            if isinstance(view, memoryview) and offset + length <= len(view):
+                return bytes(view[offset : offset + length])
+        return bytes(self[a] for a in range(address, address + length))
+
+    def write_bytes(self, address: int, data: bytes, /) -> None:
+        entry = self._table[address] if 0 <= address < len(self._table) else None
+        if entry is not None:
+            device, start = entry
+            view = getattr(device, 'view', None)
+            offset = address - start
+            if isinstance(view, memoryview) and not view.readonly and offset + len(data) <= len(view):
+                view[offset : offset + len(data)] = data
+                for callback in self._write_callbacks:
+                    for a in range(address, address + len(data)):
+                        callback(a)
                 return
-        raise RuntimeError('Device not found for this address')
+        for i, b in enumerate(data):
+            self[address + i] = b
+
+    def add_write_callback(self, callback: Callable[[int], None], /) -> None:
+        self._write_callbacks.append(callback)
 
     def load_program(self, program: BinaryIO, load_at: int, /) -> None:
-        for i, b in enumerate(program.read()):
-            self[load_at + i] = b
+        self.write_bytes(load_at, program.read())
 
     def map(self, start: int, device: Device, /) -> None:
         self._devices.append((start, start + len(device) - 1, device))
+        self._rebuild_table()
 
     def unmap_device(self, device: Device, /) -> None:
         for i, (_, _, device2) in enumerate(self._devices):
             if device == device2:
                 self._devices.pop(i)
+                self._rebuild_table()
                 return
 
     def unmap_address(self, address: int, /) -> None:
         for i, (start, _, _) in enumerate(self._devices):
             if address == start:
                 self._devices.pop(i)
+                self._rebuild_table()
                 return
@@ -1,23 +1,45 @@
-from collections.abc import Callable
+from array import array
+from collections.abc import Callable, Sequence
 from math import ceil
+from typing import Final
 
 
 class Display:
-    PIXEL_ON = '\u2588'
+    __slots__ = (
+        '_width',
+        '_height',
+        '_frame',
+        '_shadow',
+        '_zero_frame',
+        '_row_mask',
+        '_clear_callback',
+        '_update_pixel_callback',
+        '_frame_callback',
+    )
+
+    PIXEL_ON = '█'
     PIXEL_OFF = ' '
+    SPRITE_WIDTH: Final = 8
 
     def __init__(self, *, width: int, height: int) -> None:
         self._width = width
         self._height = height
-        self._frame = [[False for _ in range(width)] for _ in range(height)]
+        self._frame = array('Q', [0] * height)
+        self._shadow = array('Q', [0] * height)
+        self._zero_frame = array('Q', [0] * height)
+        self._row_mask = (1 << width) - 1
         self._clear_callback: Callable[[], None] | None = None
         self._update_pixel_callback: Callable[[int, int, bool], None] | None = None
+        self._frame_callback: Callable[[Sequence[int]], None] | None = None
 
     def __repr__(self) -> str:
         return f'Display({self.width}x{self.height})'
 
     def __str__(self) -> str:
-        return '\n'.join(''.join(self.PIXEL_ON if pixel else self.PIXEL_OFF for pixel in line) for line in self._frame)
+        return '\n'.join(
+            ''.join(self.PIXEL_ON if row >> (self.width - 1 - x) & 1 else self.PIXEL_OFF for x in range(self.width))
+            for row in self._frame
+        )
 
     @property
     def width(self) -> int:
@@ -28,40 +50,106 @@ class Display:
         return self._height
 
     def clear(self) -> None:
-        self._frame = [[False for _ in range(self.width)] for _ in range(self.height)]
+        self._frame[:] = self._zero_frame
         if self._clear_callback:
             self._clear_callback()
 
     def refresh(self) -> None:
+        if self._frame_callback:
+            if self._frame != self._shadow:
+                self._frame_callback(self._frame)
+                self._shadow[:] = self._frame
+            return
         if self._update_pixel_callback:
             for y in range(self.height):
+                row = self._frame[y]
+                changed = row ^ self._shadow[y]
+                if not changed:
+                    continue
                 for x in range(self.width):
-                    self._update_pixel_callback(x, y, self._frame[y][x])
+                    if changed >> (self.width - 1 - x) & 1:
+                        self._update_pixel_callback(x, y, bool(row >> (self.width - 1 - x) & 1))
+                self._shadow[y] = row
 
     def get_pixel(self, x: int, y: int, /) -> bool:
         x %= self.width
         y %= self.height
-        return self._frame[y][x]
+        return bool(self._frame[y] >> (self.width - 1 - x) & 1)
 
     def set_pixel(self, x: int, y: int, value: bool, /) -> bool:
         x %= self.width
         y %= self.height
+        mask = 1 << (self.width - 1 - x)
         flipped = False
-        if value and self._frame[y][x]:
+        if value and self._frame[y] & mask:
             flipped = True
             value = False
-        self._frame[y][x] = value
+        if value:
+            self._frame[y] |= mask
+        else:
+            self._frame[y] &= self._row_mask ^ mask
         if self._update_pixel_callback:
             self._update_pixel_callback(x, y, value)
         return flipped
 
-    def draw_sprite(self, x: int, y: int, sprite: list[int], /) -> bool:
+    def read_pixels(self, pixel_number: int, count: int, /) -> int:
+        width = self.width
+        value = 0
+        remaining = count
+        while remaining:
+            y, col = divmod(pixel_number, width)
+            take = min(remaining, width - col)
+            row = self._frame[y % self.height]
+            value = (value << take) | ((row >> (width - col - take)) & ((1 << take) - 1))
+            pixel_number += take
+            remaining -= take
+        return value
+
+    def write_pixels(self, pixel_number: int, count: int, value: int, /) -> None:
+        if self._update_pixel_callback:
+            for i in range(count):
+                pn = pixel_number + i
+                self.set_pixel(pn % self.width, pn // self.width, bool(value >> (count - 1 - i) & 1))
+            return
+        width = self.width
+        remaining = count
+        while remaining:
+            y, col = divmod(pixel_number, width)
+            y %= self.height
+            take = min(remaining, width - col)
+            shift = width - col - take
+            mask = ((1 << take) - 1) << shift
+            bits = ((value >> (remaining - take)) << shift) & mask
+            row = self._frame[y]
+            self._frame[y] = (row & ~mask & self._row_mask) | (bits & ~row)
+            pixel_number += take
+            remaining -= take
+
+    def _shift_sprite_line(self, line: int, x: int, /) -> int:
+        if self.width >= self.SPRITE_WIDTH:
+            base = (line << (self.width - self.SPRITE_WIDTH)) & self._row_mask
+            return ((base >> x) | (base << (self.width - x))) & self._row_mask
+        shifted = 0
+        for x2 in range(8):
+            if line >> (7 - x2) & 1:
+                shifted ^= 1 << (self.width - 1 - (x + x2) % self.width)
+        return shifted
+
+    def draw_sprite(self, x: int, y: int, sprite: Sequence[int], /) -> bool:
+        x %= self.width
         flipped = False
         for y2, line in enumerate(sprite):
-            for x2 in range(8):
-                pixel = bool(line >> (7 - x2) & 1)
-                if pixel and self.set_pixel(x + x2, y + y2, pixel):
-                    flipped = True
+            shifted = self._shift_sprite_line(line, x)
+            row_y = (y + y2) % self.height
+            old = self._frame[row_y]
+            if old & shifted:
+                flipped = True
+            new = old ^ shifted
+            self._frame[row_y] = new
+            if self._update_pixel_callback and shifted:
+                for x2 in range(self.width):
+                    if shifted >> (self.width - 1 - x2) & 1:
+                        self._update_pixel_callback(x2, row_y, bool(new >> (self.width - 1 - x2) & 1))
         return flipped
 
     def set_clear_callback(self, callback: Callable[[], None] | None, /) -> None:
@@ -70,6 +158,14 @@ class Display:
     def set_update_pixel_callback(self, callback: Callable[[int, int, bool], None] | None, /) -> None:
         self._update_pixel_callback = callback
 
+    def set_frame_callback(self, callback: Callable[[Sequence[int]], None] | None, /) -> None:
+        self._frame_callback = callback
+
+    def detach_callbacks(self) -> None:
+        self._clear_callback = None
+        self._update_pixel_callback = None
+        self._frame_callback = None
+
 
 class AddressableDisplay:
     def __init__(self, display: Display, /) -> None:
@@ -81,15 +177,8 @@ class AddressableDisplay:
     def __len__(self) -> int:
         return ceil(self._display.width * self._display.height / 8)
 
-    def _calc_pixel_position(self, pixel_number: int, /) -> tuple[int, int]:
-        return pixel_number % self._display.width, pixel_number // self._display.width
-
     def __getitem__(self, address: int, /) -> int:
-        value = 0
-        for pixel_number in range(address * 8, (address + 1) * 8):
-            value = (value << 1) | self._display.get_pixel(*self._calc_pixel_position(pixel_number))
-        return value
+        return self._display.read_pixels(address * 8, 8)
 
     def __setitem__(self, address: int, value: int, /) -> None:
-        for i, pixel_number in enumerate(range(address * 8, (address + 1) * 8)):
-            self._display.set_pixel(*self._calc_pixel_position(pixel_number), bool(value >> (7 - i) & 1))
+        self._display.write_pixels(address * 8, 8, value)
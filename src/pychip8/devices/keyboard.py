@@ -1,4 +1,3 @@
-from asyncio import Future
 from enum import IntEnum, auto
 
 
@@ -22,31 +21,32 @@ class Key(IntEnum):
 
 
 class Keyboard:
+    __slots__ = ('_mask',)
+
     def __init__(self) -> None:
-        self._pressed = [False for _ in range(len(Key))]
-        self._notify_pressed: list[Future[Key]] = []
+        self._mask = 0
 
     def __repr__(self) -> str:
-        keys = ', '.join(
-            f'{key.name.removeprefix("KEY")}' for key, value in zip(Key, self._pressed, strict=True) if value
-        )
+        keys = ', '.join(f'{key.name.removeprefix("KEY")}' for key in Key if self._mask >> key & 1)
         return f'Keyboard(pressed="{keys}")'
 
     def __len__(self) -> int:
-        return len(self._pressed)
+        return len(Key)
 
-    def __getitem__(self, key: Key, /) -> bool:
-        return self._pressed[key]
+    def __getitem__(self, key: int, /) -> bool:
+        return bool(self._mask >> key & 1)
 
-    def __setitem__(self, key: Key, value: bool, /) -> None:
-        self._pressed[key] = value
+    def __setitem__(self, key: int, value: bool, /) -> None:
         if value:
-            while self._notify_pressed:
-                future = self._notify_pressed.pop()
-                if not future.cancelled():
-                    future.set_result(key)
-
-    def next_key_pressed(self) -> Future[Key]:
-        future: Future[Key] = Future()
-        self._notify_pressed.append(future)
-        return future
+            self._mask |= 1 << key
+        else:
+            self._mask &= ~(1 << key)
+
+    def set_pressed_mask(self, mask: int, /) -> None:
+        self._mask = mask
+
+    def first_pressed_key(self) -> Key | None:
+        mask = self._mask
+        if not mask:
+            return None
+        return Key((mask & -mask).bit_length() - 1)
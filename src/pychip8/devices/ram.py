@@ -1,6 +1,8 @@
 class Ram:
+    __slots__ = ('_memory',)
+
     def __init__(self, *, size: int) -> None:
-        self._memory = [0 for _ in range(size)]
+        self._memory = bytearray(size)
 
     def __repr__(self) -> str:
         return f'Ram(size={len(self)})'
@@ -13,3 +15,7 @@ class Ram:
 
     def __setitem__(self, address: int, value: int, /) -> None:
         self._memory[address] = value & 0xFF
+
+    @property
+    def view(self) -> memoryview:
+        return memoryview(self._memory)
@@ -21,10 +21,12 @@ class Rom:
         [0xF0, 0x80, 0xF0, 0x80, 0x80],
     ]
 
+    __slots__ = ('_memory',)
+
     def __init__(self, *, size: int) -> None:
-        memory = [byte for sprite in self.SPRITES for byte in sprite]
+        memory = bytes(byte for sprite in self.SPRITES for byte in sprite)
         padding = size - len(memory)
-        self._memory = memory + [0] * padding
+        self._memory = memory + bytes(max(padding, 0))
 
     def __repr__(self) -> str:
         return f'Rom(size={len(self)})'
@@ -37,3 +39,7 @@ class Rom:
 
     def __setitem__(self, address: int, value: int, /) -> None:
         raise RuntimeError('Writing on ROM')
+
+    @property
+    def view(self) -> memoryview:
+        return memoryview(self._memory)
@@ -6,11 +6,18 @@ from contextlib import contextmanager
 from pathlib import Path
 from typing import BinaryIO, Final
 
-from pychip8.clock import clock
+from pychip8.clock import run_clock
 from pychip8.cpu import Chip8
 from pychip8.devices.keyboard import Key
 
 
+def _build_key_table(keys: dict[str, Key], size: int, /) -> tuple[Key | None, ...]:
+    table: list[Key | None] = [None] * size
+    for char, key in keys.items():
+        table[ord(char)] = key
+    return tuple(table)
+
+
 @contextmanager
 def ncurses_environment() -> Iterator['curses._CursesWindow']:
     stdscr = None
@@ -53,6 +60,8 @@ class Window:
         'v': Key.KEYF,
     }
     CLOSE_KEY: Final = '\x1b'
+    _KEY_TABLE: Final = _build_key_table(KEYS, 128)
+    _CLOSE_KEYCODE: Final = ord(CLOSE_KEY)
 
     def __init__(self, *, cpu: Chip8, scr: 'curses._CursesWindow') -> None:
         self._cpu = cpu
@@ -67,37 +76,69 @@ class Window:
                 f'Small terminal ({columns}x{lines}), minimum {self._display.width}x{self._display.height + 1}',
             )
 
+        self._shadow = bytearray(self._display.width * self._display.height)
+        self._dirty_rows: set[int] = set()
+        self._running = False
+        self._hold_ticks = 1
+        self._hold_remaining = 0
+
         self._display.set_update_pixel_callback(self.set_pixel)
         self._display.set_clear_callback(self.clear)
+        self._cpu.set_update_callback(self.flush)
 
     def close(self) -> None:
-        self._display.set_update_pixel_callback(None)
-        self._display.set_clear_callback(None)
+        self._display.detach_callbacks()
+        self._cpu.set_update_callback(None)
 
     def clear(self) -> None:
-        self._scr.clear()
+        self._shadow[:] = bytes(len(self._shadow))
+        self._dirty_rows.update(range(self._display.height))
 
     def set_pixel(self, x: int, y: int, value: bool, /) -> None:
-        self._scr.move(y, x)
-        self._scr.addch(self.WHITE_PIXEL if value else self.BLACK_PIXEL)
-
-    def run(self, hz: int, /) -> None:
-        cpu_clock = clock(self._cpu, hz)
-        running = True
-        while running:
-            next(cpu_clock)
-            for key in Key:
-                self._keyboard[key] = False
-            try:
-                char = self._scr.getkey()
-                if char == self.CLOSE_KEY:
-                    running = False
-                    break
-                key_pressed = self.KEYS.get(char)
-                if key_pressed is not None:
-                    self._keyboard[key_pressed] = True
-            except curses.error:
-                ...
+        self._shadow[y * self._display.width + x] = value
+        self._dirty_rows.add(y)
+
+    def flush(self) -> None:
+        if not self._dirty_rows:
+            return
+        width = self._display.width
+        for y in sorted(self._dirty_rows):
+            row = self._shadow[y * width : (y + 1) * width]
+            self._scr.addstr(y, 0, ''.join(self.WHITE_PIXEL if pixel else self.BLACK_PIXEL for pixel in row))
+        self._dirty_rows.clear()
+        self._scr.noutrefresh()
+        curses.doupdate()
+
+    def _poll_input(self) -> bool:
+        getch = self._scr.getch
+        close_keycode = self._CLOSE_KEYCODE
+        key_table = self._KEY_TABLE
+        table_size = len(key_table)
+        mask = 0
+        while True:
+            ch = getch()
+            if ch == -1:
+                break
+            if ch == close_keycode:
+                self._running = False
+                break
+            key_pressed = key_table[ch] if 0 <= ch < table_size else None
+            if key_pressed is not None:
+                mask |= 1 << key_pressed
+        if mask:
+            self._hold_remaining = self._hold_ticks
+            self._keyboard.set_pressed_mask(mask)
+        elif self._hold_remaining:
+            self._hold_remaining -= 1
+            if not self._hold_remaining:
+                self._keyboard.set_pressed_mask(0)
+        return self._running
+
+    def run(self, hz: int, /, *, batch: int = 1) -> None:
+        self._hold_ticks = max(hz // 10, batch)
+        self._hold_remaining = 0
+        self._running = True
+        run_clock(self._cpu, hz, self._poll_input, batch=batch)
         self.close()
 
 
@@ -112,7 +153,7 @@ def main(
         cpu = Chip8.new_cosmac_vip_with_4096_ram(instructions_per_update=instructions_per_update)
         cpu.load_program(program)
         window = Window(cpu=cpu, scr=stdscr)
-        window.run(clock)
+        window.run(clock, batch=instructions_per_update)
 
 
 if __name__ == '__main__':
@@ -1,19 +1,30 @@
+import ctypes
 import sys
-from collections.abc import Iterator
+from collections.abc import Callable, Iterator, Sequence
 from contextlib import contextmanager
 from pathlib import Path
-from typing import BinaryIO, Final
+from time import perf_counter
+from typing import BinaryIO, ClassVar, Final
 
 import sdl2
 import sdl2.ext
 
-from pychip8.clock import clock
+from pychip8.clock import run_clock
 from pychip8.cpu import Chip8
 from pychip8.devices.keyboard import Key
 
 
+def _build_key_table(keys: dict[int, Key], size: int, /) -> tuple[Key | None, ...]:
+    table: list[Key | None] = [None] * size
+    for code, key in keys.items():
+        table[code] = key
+    return tuple(table)
+
+
 @contextmanager
 def sdl_environment() -> Iterator[None]:
+    sdl2.SDL_SetHint(sdl2.SDL_HINT_RENDER_BATCHING, b'1')
+    sdl2.SDL_SetHint(sdl2.SDL_HINT_RENDER_SCALE_QUALITY, b'0')
     sdl2.ext.init()
     yield
     sdl2.ext.quit()
@@ -22,6 +33,9 @@ def sdl_environment() -> Iterator[None]:
 class Window:
     BLACK_PIXEL: Final = sdl2.ext.Color(0, 0, 0)
     WHITE_PIXEL: Final = sdl2.ext.Color(255, 255, 255)
+    PIXEL_OFF: Final = 0xFF000000
+    PIXEL_ON: Final = 0xFFFFFFFF
+    PRESENT_HZ: Final = 60
     KEYS: Final = {
         sdl2.SDLK_1: Key.KEY1,
         sdl2.SDLK_2: Key.KEY2,
@@ -40,9 +54,11 @@ class Window:
         sdl2.SDLK_f: Key.KEYE,
         sdl2.SDLK_v: Key.KEYF,
     }
+    _KEY_TABLE: Final = _build_key_table(KEYS, 128)
 
     def __init__(self, *, cpu: Chip8, size: tuple[int, int]) -> None:
         self._cpu = cpu
+        self._running = False
         self._display = cpu.display
         self._keyboard = cpu.keyboard
 
@@ -51,52 +67,117 @@ class Window:
         self._render = sdl2.ext.Renderer(self._window, logical_size=(self._display.width, self._display.height))
         self._render.clear(self.BLACK_PIXEL)
         self._render.present()
-
+        self._renderer_ptr = self._render.sdlrenderer
+
+        self._texture = sdl2.SDL_CreateTexture(
+            self._renderer_ptr,
+            sdl2.SDL_PIXELFORMAT_ARGB8888,
+            sdl2.SDL_TEXTUREACCESS_STREAMING,
+            self._display.width,
+            self._display.height,
+        )
         self._need_update = False
-        self._frame = [[False for _ in range(self._display.width)] for _ in range(self._display.height)]
-
-        self._display.set_update_pixel_callback(self.set_pixel)
-        self._display.set_clear_callback(self.clear)
+        pixel_on = self.PIXEL_ON.to_bytes(4, sys.byteorder)
+        pixel_off = self.PIXEL_OFF.to_bytes(4, sys.byteorder)
+        self._byte_pixels = tuple(
+            b''.join(pixel_on if byte >> (7 - bit) & 1 else pixel_off for bit in range(8)) for byte in range(256)
+        )
+        self._row_pad = -self._display.width % 8
+        self._row_bytes = (self._display.width + self._row_pad) // 8
+        self._row_size = self._display.width * 4
+        self._frame = bytearray(pixel_off * (self._display.width * self._display.height))
+        self._frame_buffer = (ctypes.c_ubyte * len(self._frame)).from_buffer(self._frame)
+
+        self._present_period = 1 / self.PRESENT_HZ
+        self._next_present = 0.0
+
+        self._event = sdl2.SDL_Event()
+        self._event_ref = ctypes.byref(self._event)
+
+        self._display.set_frame_callback(self.update_frame)
         self._cpu.set_update_callback(self.show_frame)
 
     def close(self) -> None:
-        self._display.set_update_pixel_callback(None)
-        self._display.set_clear_callback(None)
+        self._display.detach_callbacks()
         self._cpu.set_update_callback(None)
+        sdl2.SDL_DestroyTexture(self._texture)
         self._render.destroy()
         self._window.close()
 
-    def clear(self) -> None:
-        self._frame = [[False for _ in range(self._display.width)] for _ in range(self._display.height)]
-        self._need_update = True
-
-    def set_pixel(self, x: int, y: int, value: bool, /) -> None:
-        self._frame[y][x] = value
+    def update_frame(self, rows: Sequence[int], /) -> None:
+        pad = self._row_pad
+        row_bytes = self._row_bytes
+        row_size = self._row_size
+        byte_pixels = self._byte_pixels
+        self._frame[:] = b''.join(
+            b''.join(byte_pixels[byte] for byte in (row << pad).to_bytes(row_bytes, 'big'))[:row_size] for row in rows
+        )
         self._need_update = True
 
     def show_frame(self) -> None:
-        if self._need_update:
-            self._need_update = False
-            for y, line in enumerate(self._frame):
-                for x, pixel in enumerate(line):
-                    self._render.draw_point((x, y), self.WHITE_PIXEL if pixel else self.BLACK_PIXEL)
-            self._render.present()
-
-    def run(self, hz: int, /) -> None:
-        cpu_clock = clock(self._cpu, hz)
-        running = True
-        while running:
-            next(cpu_clock)
-            for event in sdl2.ext.get_events():
-                if event.type == sdl2.SDL_QUIT or (
-                    event.type == sdl2.SDL_KEYDOWN and event.key.keysym.sym == sdl2.SDLK_ESCAPE
-                ):
-                    running = False
-                    break
-                if event.type in (sdl2.SDL_KEYDOWN, sdl2.SDL_KEYUP):
-                    key = self.KEYS.get(event.key.keysym.sym)
-                    if key is not None:
-                        self._keyboard[key] = event.type == sdl2.SDL_KEYDOWN
+        self._display.refresh()
+        if not self._need_update:
+            return
+        now = perf_counter()
+        if now < self._next_present:
+            return
+        self._next_present = now + self._present_period
+        self._need_update = False
+        pixels = ctypes.c_void_p()
+        pitch = ctypes.c_int()
+        if sdl2.SDL_LockTexture(self._texture, None, ctypes.byref(pixels), ctypes.byref(pitch)) == 0:
+            row_bytes = self._display.width * 4
+            if pitch.value == row_bytes:
+                ctypes.memmove(pixels, self._frame_buffer, len(self._frame))
+            else:
+                src = ctypes.addressof(self._frame_buffer)
+                dst = pixels.value or 0
+                for _ in range(self._display.height):
+                    ctypes.memmove(dst, src, row_bytes)
+                    src += row_bytes
+                    dst += pitch.value
+            sdl2.SDL_UnlockTexture(self._texture)
+        sdl2.SDL_RenderCopy(self._renderer_ptr, self._texture, None, None)
+        sdl2.SDL_RenderPresent(self._renderer_ptr)
+
+    def _handle_quit(self, event: sdl2.SDL_Event, /) -> None:  # noqa: ARG002
+        self._running = False
+
+    def _handle_keydown(self, event: sdl2.SDL_Event, /) -> None:
+        sym = event.key.keysym.sym
+        if sym == sdl2.SDLK_ESCAPE:
+            self._running = False
+            return
+        key = self._KEY_TABLE[sym] if 0 <= sym < len(self._KEY_TABLE) else None
+        if key is not None:
+            self._keyboard[key] = True
+
+    def _handle_keyup(self, event: sdl2.SDL_Event, /) -> None:
+        sym = event.key.keysym.sym
+        key = self._KEY_TABLE[sym] if 0 <= sym < len(self._KEY_TABLE) else None
+        if key is not None:
+            self._keyboard[key] = False
+
+    _HANDLERS: ClassVar[dict[int, Callable[['Window', sdl2.SDL_Event], None]]] = {
+        sdl2.SDL_QUIT: _handle_quit,
+        sdl2.SDL_KEYDOWN: _handle_keydown,
+        sdl2.SDL_KEYUP: _handle_keyup,
+    }
+
+    def _pump_events(self) -> bool:
+        poll = sdl2.SDL_PollEvent
+        event = self._event
+        event_ref = self._event_ref
+        get_handler = self._HANDLERS.get
+        while poll(event_ref):
+            handler = get_handler(event.type)
+            if handler is not None:
+                handler(self, event)
+        return self._running
+
+    def run(self, hz: int, /, *, batch: int = 1) -> None:
+        self._running = True
+        run_clock(self._cpu, hz, self._pump_events, batch=batch)
         self.close()
 
 
@@ -111,7 +192,7 @@ def main(
         cpu = Chip8.new_cosmac_vip_with_4096_ram(instructions_per_update=instructions_per_update)
         cpu.load_program(program)
         window = Window(cpu=cpu, size=size)
-        window.run(clock)
+        window.run(clock, batch=instructions_per_update)
 
 
 if __name__ == '__main__':
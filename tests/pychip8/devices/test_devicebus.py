@@ -1,20 +1,32 @@
 from io import BytesIO
 from random import randint
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, call
 
 import pytest
 
 from pychip8.devices.devicebus import Device, DeviceBus
+from pychip8.devices.ram import Ram
+
+_mock_devices = (MagicMock(spec_set=Device), MagicMock(spec_set=Device))
+
+
+def _reset_device_mocks() -> tuple[MagicMock, MagicMock]:
+    for mock_device in _mock_devices:
+        mock_device.reset_mock()
+        mock_device.__len__.reset_mock(return_value=True, side_effect=True)
+        mock_device.__getitem__.reset_mock(return_value=True, side_effect=True)
+        mock_device.__setitem__.reset_mock(return_value=True, side_effect=True)
+    return _mock_devices
 
 
 class TestDeviceBus:
     def test_repr(self) -> None:
         for _ in range(10):
             number_devices = randint(0, 10)
+            mock_device, _ = _reset_device_mocks()
 
             sut = DeviceBus()
             for _ in range(number_devices):
-                mock_device = MagicMock(spec_set=Device)
                 sut.map(0, mock_device)
 
             assert repr(sut) == f'DeviceBus(devices={number_devices})'
@@ -26,13 +38,14 @@ class TestDeviceBus:
 
     def test_length_with_devices_in_order(self) -> None:
         for _ in range(10):
+            mock_device, _ = _reset_device_mocks()
+
             sut = DeviceBus()
 
             address = 0
             for _ in range(10):
                 size = randint(1, 1024)
 
-                mock_device = MagicMock(spec_set=Device)
                 mock_device.__len__.return_value = size
 
                 sut.map(address, mock_device)
@@ -42,10 +55,8 @@ class TestDeviceBus:
 
     def test_length_with_devices_in_diferent_order(self) -> None:
         for _ in range(10):
-            mock_device1 = MagicMock(spec_set=Device)
+            mock_device1, mock_device2 = _reset_device_mocks()
             mock_device1.__len__.return_value = randint(1, 1024)
-
-            mock_device2 = MagicMock(spec_set=Device)
             mock_device2.__len__.return_value = randint(1, 1024)
 
             sut = DeviceBus()
@@ -72,11 +83,9 @@ class TestDeviceBus:
             address2 = randint(start2, start2 + size2 - 1)
             value2 = object()
 
-            mock_device1 = MagicMock(spec_set=Device)
+            mock_device1, mock_device2 = _reset_device_mocks()
             mock_device1.__len__.return_value = size1
             mock_device1.__getitem__.return_value = value1
-
-            mock_device2 = MagicMock(spec_set=Device)
             mock_device2.__len__.return_value = size2
             mock_device2.__getitem__.return_value = value2
 
@@ -94,7 +103,7 @@ class TestDeviceBus:
             size = randint(1, 1024)
             address = randint(100, 1024)
 
-            mock_device = MagicMock(spec_set=Device)
+            mock_device, _ = _reset_device_mocks()
             mock_device.__len__.return_value = size
 
             sut = DeviceBus()
@@ -124,10 +133,8 @@ class TestDeviceBus:
             address2 = randint(start2, start2 + size2 - 1)
             value2 = randint(0, 255)
 
-            mock_device1 = MagicMock(spec_set=Device)
+            mock_device1, mock_device2 = _reset_device_mocks()
             mock_device1.__len__.return_value = size1
-
-            mock_device2 = MagicMock(spec_set=Device)
             mock_device2.__len__.return_value = size2
 
             sut = DeviceBus()
@@ -145,7 +152,7 @@ class TestDeviceBus:
             size = randint(1, 1024)
             address = randint(100, 1024)
 
-            mock_device = MagicMock(spec_set=Device)
+            mock_device, _ = _reset_device_mocks()
             mock_device.__len__.return_value = size
 
             sut = DeviceBus()
@@ -157,13 +164,116 @@ class TestDeviceBus:
             with pytest.raises(RuntimeError, match='^Device not found for this address$'):
                 sut[randint(address + size, (address + size) * 2)] = 0
 
+    def test_read_bytes(self) -> None:
+        for _ in range(10):
+            size = randint(8, 1024)
+            content = [randint(0, 255) for _ in range(size)]
+            start = randint(0, 1024)
+            offset = randint(0, size // 2)
+            length = randint(1, size // 2)
+
+            mock_device, _ = _reset_device_mocks()
+            mock_device.__len__.return_value = size
+            mock_device.__getitem__.side_effect = content.__getitem__
+
+            sut = DeviceBus()
+            sut.map(start, mock_device)
+
+            assert sut.read_bytes(start + offset, length) == bytes(content[offset : offset + length])
+
+    def test_read_bytes_without_devices(self) -> None:
+        sut = DeviceBus()
+
+        with pytest.raises(RuntimeError, match='^Device not found for this address$'):
+            sut.read_bytes(randint(0, 1024), randint(1, 16))
+
+    def test_write_bytes(self) -> None:
+        for _ in range(10):
+            size = randint(8, 1024)
+            start = randint(0, 1024)
+            offset = randint(0, size // 2)
+            data = bytes(randint(0, 255) for _ in range(randint(1, size // 2)))
+
+            mock_device, _ = _reset_device_mocks()
+            mock_device.__len__.return_value = size
+
+            sut = DeviceBus()
+            sut.map(start, mock_device)
+
+            sut.write_bytes(start + offset, data)
+
+            assert mock_device.__setitem__.call_args_list == [call(offset + i, value) for i, value in enumerate(data)]
+
+    def test_write_bytes_into_device_view(self) -> None:
+        for _ in range(10):
+            size = randint(8, 1024)
+            start = randint(0, 1024)
+            offset = randint(0, size // 2)
+            data = bytes(randint(0, 255) for _ in range(randint(1, size // 2)))
+
+            ram = Ram(size=size)
+
+            sut = DeviceBus()
+            sut.map(start, ram)
+
+            sut.write_bytes(start + offset, data)
+
+            assert bytes(ram.view[offset : offset + len(data)]) == data
+
+    def test_write_bytes_without_devices(self) -> None:
+        sut = DeviceBus()
+
+        with pytest.raises(RuntimeError, match='^Device not found for this address$'):
+            sut.write_bytes(randint(0, 1024), bytes([randint(0, 255)]))
+
+    def test_write_address_should_call_write_callback(self) -> None:
+        for _ in range(10):
+            size = randint(1, 1024)
+            address = randint(0, size - 1)
+
+            mock_device, _ = _reset_device_mocks()
+            mock_device.__len__.return_value = size
+
+            mock_callback = MagicMock()
+
+            sut = DeviceBus()
+            sut.map(0, mock_device)
+            sut.add_write_callback(mock_callback)
+
+            sut[address]
+            mock_callback.assert_not_called()
+
+            sut[address] = 0
+            mock_callback.assert_called_once_with(address)
+
+    def test_write_address_should_call_all_write_callbacks(self) -> None:
+        for _ in range(10):
+            size = randint(1, 1024)
+            address = randint(0, size - 1)
+
+            mock_device, _ = _reset_device_mocks()
+            mock_device.__len__.return_value = size
+
+            mock_callback1 = MagicMock()
+            mock_callback2 = MagicMock()
+
+            sut = DeviceBus()
+            sut.map(0, mock_device)
+            sut.add_write_callback(mock_callback1)
+            sut.add_write_callback(mock_callback2)
+
+            sut[address] = 0
+
+            mock_callback1.assert_called_once_with(address)
+            mock_callback2.assert_called_once_with(address)
+
     def test_load_program(self) -> None:
         for _ in range(10):
             address = randint(0, 2048)
             content = [randint(0, 255) for _ in range(randint(1, 512))]
             program = BytesIO(bytes(content))
 
-            mock_device = MagicMock(spec_set=Device)
+            mock_device, _ = _reset_device_mocks()
             mock_device.__len__.return_value = 4096
 
             sut = DeviceBus()
@@ -171,12 +281,12 @@ class TestDeviceBus:
 
             sut.load_program(program, address)
 
-            assert mock_device.__setitem__.call_count == len(content)
-            for i, value in enumerate(content):
-                mock_device.__setitem__.assert_any_call(address + i, value)
+            assert mock_device.__setitem__.call_args_list == [
+                call(address + i, value) for i, value in enumerate(content)
+            ]
 
     def test_unmap_without_device_mapped(self) -> None:
-        mock_device = MagicMock(spec_set=Device)
+        mock_device, _ = _reset_device_mocks()
 
         sut = DeviceBus()
 
@@ -188,7 +298,7 @@ class TestDeviceBus:
             size = randint(1, 1024)
             address = randint(start, start + size - 1)
 
-            mock_device = MagicMock(spec_set=Device)
+            mock_device, _ = _reset_device_mocks()
             mock_device.__len__.return_value = size
 
             sut = DeviceBus()
@@ -211,10 +321,8 @@ class TestDeviceBus:
             start2 = randint(1024 if i % 2 else 0, 2048 - size2 if i % 2 else 1024 - size2)
             address2 = randint(start2, start2 + size2 - 1)
 
-            mock_device1 = MagicMock(spec_set=Device)
+            mock_device1, mock_device2 = _reset_device_mocks()
             mock_device1.__len__.return_value = size1
-
-            mock_device2 = MagicMock(spec_set=Device)
             mock_device2.__len__.return_value = size2
 
             sut = DeviceBus()
@@ -231,7 +339,7 @@ class TestDeviceBus:
                 sut[address2]
 
     def test_unmap_without_address_mapped(self) -> None:
-        mock_device = MagicMock(spec_set=Device)
+        mock_device, _ = _reset_device_mocks()
 
         sut = DeviceBus()
 
@@ -243,7 +351,7 @@ class TestDeviceBus:
             size = randint(1, 1024)
             address = randint(start, start + size - 1)
 
-            mock_device = MagicMock(spec_set=Device)
+            mock_device, _ = _reset_device_mocks()
             mock_device.__len__.return_value = size
 
             sut = DeviceBus()
@@ -266,10 +374,8 @@ class TestDeviceBus:
             start2 = randint(1024 if i % 2 else 0, 2048 - size2 if i % 2 else 1024 - size2)
             address2 = randint(start2, start2 + size2 - 1)
 
-            mock_device1 = MagicMock(spec_set=Device)
+            mock_device1, mock_device2 = _reset_device_mocks()
             mock_device1.__len__.return_value = size1
-
-            mock_device2 = MagicMock(spec_set=Device)
             mock_device2.__len__.return_value = size2
 
             sut = DeviceBus()
@@ -1,99 +1,94 @@
-from collections.abc import Callable
 from math import ceil
 from random import choice, randint
 from unittest.mock import MagicMock
 
+import pytest
+
 from pychip8.devices.display import AddressableDisplay, Display
 
+SIZES = [(1, 1), (1, 16), (32, 1), (17, 9), (32, 16)]
+BITS = tuple(tuple(byte >> (7 - i) & 1 for i in range(8)) for byte in range(256))
+PIXEL_CHARS = str.maketrans('01', Display.PIXEL_OFF + Display.PIXEL_ON)
 
-class TestDisplay:
-    def test_repr(self) -> None:
-        for _ in range(10):
-            width = randint(1, 32)
-            height = randint(1, 16)
 
-            sut = Display(width=width, height=height)
+@pytest.fixture(scope='module')
+def displays() -> dict[tuple[int, int], Display]:
+    return {(width, height): Display(width=width, height=height) for width, height in SIZES}
 
-            assert repr(sut) == f'Display({width}x{height})'
 
-    def test_str_clean_display(self) -> None:
-        for _ in range(10):
-            width = randint(1, 32)
-            height = randint(1, 16)
+def _fill_display(display: Display, value: bool, /) -> None:
+    count = display.width * display.height
+    display.write_pixels(0, count, (1 << count) - 1 if value else 0)
 
-            sut = Display(width=width, height=height)
 
-            assert str(sut) == '\n'.join(Display.PIXEL_OFF * width for _ in range(height))
+def _fill_frame(display: Display, frame: list[list[bool]], /) -> None:
+    pixels = ''.join('1' if pixel else '0' for line in frame for pixel in line)
+    display.write_pixels(0, len(pixels), int(pixels, 2))
 
-    def test_str_full_display(self) -> None:
-        for _ in range(10):
-            width = randint(1, 32)
-            height = randint(1, 16)
 
-            sut = Display(width=width, height=height)
-            for y in range(height):
-                for x in range(width):
-                    sut.set_pixel(x, y, True)
+class TestDisplay:
+    def test_pixel_chars(self) -> None:
+        assert Display.PIXEL_OFF == ' '
+        assert Display.PIXEL_ON == '█'
 
-            assert str(sut) == '\n'.join(Display.PIXEL_ON * width for _ in range(height))
+    @pytest.mark.parametrize(('width', 'height'), SIZES)
+    def test_repr(self, displays: dict[tuple[int, int], Display], width: int, height: int) -> None:
+        sut = displays[width, height]
 
-    def test_str_random_values(self) -> None:
-        for _ in range(10):
-            width = randint(1, 32)
-            height = randint(1, 16)
-            frame = [[choice([True, False]) for _ in range(width)] for _ in range(height)]
+        assert repr(sut) == f'Display({width}x{height})'
 
-            sut = Display(width=width, height=height)
-            for y in range(height):
-                for x in range(width):
-                    sut.set_pixel(x, y, frame[y][x])
+    @pytest.mark.parametrize(('width', 'height'), SIZES)
+    def test_str_clean_display(self, width: int, height: int) -> None:
+        sut = Display(width=width, height=height)
 
-            assert str(sut) == '\n'.join(
-                ''.join(Display.PIXEL_ON if pixel else Display.PIXEL_OFF for pixel in line) for line in frame
-            )
+        assert str(sut) == '\n'.join(Display.PIXEL_OFF * width for _ in range(height))
+
+    @pytest.mark.parametrize(('width', 'height'), SIZES)
+    def test_str_full_display(self, width: int, height: int) -> None:
+        sut = Display(width=width, height=height)
+        _fill_display(sut, True)
 
-    def test_size(self) -> None:
+        assert str(sut) == '\n'.join(Display.PIXEL_ON * width for _ in range(height))
+
+    def test_str_random_values(self) -> None:
         for _ in range(10):
             width = randint(1, 32)
             height = randint(1, 16)
+            frame = [[choice([True, False]) for _ in range(width)] for _ in range(height)]
 
             sut = Display(width=width, height=height)
+            _fill_frame(sut, frame)
 
-            assert sut.width == width
-            assert sut.height == height
+            raw = ''.join('1' if pixel else '0' for line in frame for pixel in line)
+            assert str(sut) == '\n'.join(raw[i : i + width] for i in range(0, len(raw), width)).translate(PIXEL_CHARS)
 
-    def test_start_with_clear_display(self) -> None:
-        for _ in range(10):
-            width = randint(1, 32)
-            height = randint(1, 16)
+    @pytest.mark.parametrize(('width', 'height'), SIZES)
+    def test_size(self, displays: dict[tuple[int, int], Display], width: int, height: int) -> None:
+        sut = displays[width, height]
 
-            sut = Display(width=width, height=height)
+        assert sut.width == width
+        assert sut.height == height
 
-            for y in range(height):
-                for x in range(width):
-                    assert sut.get_pixel(x, y) is False
+    @pytest.mark.parametrize(('width', 'height'), SIZES)
+    def test_start_with_clear_display(self, displays: dict[tuple[int, int], Display], width: int, height: int) -> None:
+        sut = displays[width, height]
 
-    def test_clear_display(self) -> None:
-        for _ in range(10):
-            width = randint(1, 32)
-            height = randint(1, 16)
+        assert str(sut) == '\n'.join(Display.PIXEL_OFF * width for _ in range(height))
 
-            sut = Display(width=width, height=height)
-            for y in range(height):
-                for x in range(width):
-                    sut.set_pixel(x, y, True)
+    @pytest.mark.parametrize(('width', 'height'), SIZES)
+    def test_clear_display(self, width: int, height: int) -> None:
+        sut = Display(width=width, height=height)
+        _fill_display(sut, True)
 
-            sut.clear()
+        sut.clear()
 
-            for y in range(height):
-                for x in range(width):
-                    assert sut.get_pixel(x, y) is False
+        assert str(sut) == '\n'.join(Display.PIXEL_OFF * width for _ in range(height))
 
     def test_clear_should_call_clear_callback(self) -> None:
         width = randint(1, 32)
         height = randint(1, 16)
 
-        mock_callback = MagicMock(spec_set=Callable)
+        mock_callback = MagicMock()
 
         sut = Display(width=width, height=height)
         sut.set_clear_callback(mock_callback)
@@ -104,92 +99,158 @@ class TestDisplay:
 
         mock_callback.assert_called_once_with()
 
+    def test_detach_callbacks(self) -> None:
+        mock_clear_callback = MagicMock()
+        mock_update_pixel_callback = MagicMock()
+        mock_frame_callback = MagicMock()
+
+        sut = Display(width=randint(1, 32), height=randint(1, 16))
+        sut.set_clear_callback(mock_clear_callback)
+        sut.set_update_pixel_callback(mock_update_pixel_callback)
+        sut.set_frame_callback(mock_frame_callback)
+
+        sut.detach_callbacks()
+
+        sut.set_pixel(0, 0, True)
+        sut.clear()
+        sut.refresh()
+
+        mock_clear_callback.assert_not_called()
+        mock_update_pixel_callback.assert_not_called()
+        mock_frame_callback.assert_not_called()
+
     def test_refresh(self) -> None:
+        calls: list[tuple[int, int, bool]] = []
+
+        def record(x: int, y: int, value: bool) -> None:
+            calls.append((x, y, value))
+
         for _ in range(10):
             width = randint(1, 16)
             height = randint(1, 8)
             frame = [[choice([True, False]) for _ in range(width)] for _ in range(height)]
+            pixels_on = {(x, y) for y in range(height) for x in range(width) if frame[y][x]}
 
-            mock_callback = MagicMock(spec_set=Callable)
+            calls.clear()
+            sut = Display(width=width, height=height)
+            _fill_frame(sut, frame)
+            sut.set_update_pixel_callback(record)
+
+            sut.refresh()
+
+            assert len(calls) == len(pixels_on)
+            assert set(calls) == {(x, y, True) for x, y in pixels_on}
+
+    def test_refresh_only_reports_changed_pixels(self) -> None:
+        for _ in range(10):
+            width = randint(1, 16)
+            height = randint(1, 8)
+            x = randint(0, width - 1)
+            y = randint(0, height - 1)
+
+            mock_callback = MagicMock()
             sut = Display(width=width, height=height)
-            for y in range(height):
-                for x in range(width):
-                    sut.set_pixel(x, y, frame[y][x])
             sut.set_update_pixel_callback(mock_callback)
+            sut.refresh()
+            mock_callback.reset_mock()
+
+            sut.refresh()
+            mock_callback.assert_not_called()
+
+            sut.set_pixel(x, y, True)
+            mock_callback.reset_mock()
+
+            sut.refresh()
+            mock_callback.assert_called_once_with(x, y, True)
+
+    def test_refresh_with_frame_callback(self) -> None:
+        for _ in range(10):
+            width = randint(1, 16)
+            height = randint(1, 8)
+            frame = [[choice([True, False]) for _ in range(width)] for _ in range(height)]
+            frame[randint(0, height - 1)][randint(0, width - 1)] = True
+
+            mock_callback = MagicMock()
+            sut = Display(width=width, height=height)
+            _fill_frame(sut, frame)
+            sut.set_frame_callback(mock_callback)
 
             sut.refresh()
 
-            assert mock_callback.call_count == sut.width * sut.height
+            mock_callback.assert_called_once()
+            rows = mock_callback.call_args.args[0]
             for y in range(height):
                 for x in range(width):
-                    mock_callback.assert_any_call(x, y, frame[y][x])
+                    assert bool(rows[y] >> (width - 1 - x) & 1) is frame[y][x]
 
-    def test_refresh_witchout_callback(self) -> None:
+    def test_refresh_with_frame_callback_should_skip_unchanged_frame(self) -> None:
+        mock_callback = MagicMock()
         sut = Display(width=randint(1, 32), height=randint(1, 16))
+        sut.set_frame_callback(mock_callback)
 
         sut.refresh()
+        mock_callback.assert_not_called()
 
-    def test_read_write_pixel(self) -> None:
-        for _ in range(10):
-            width = randint(1, 32)
-            height = randint(1, 16)
+        sut.set_pixel(0, 0, True)
+        sut.refresh()
+        mock_callback.assert_called_once()
 
-            sut = Display(width=width, height=height)
+        sut.refresh()
+        mock_callback.assert_called_once()
 
-            for y in range(height):
-                for x in range(width):
-                    assert sut.get_pixel(x, y) is False
-                    sut.set_pixel(x, y, True)
-                    assert sut.get_pixel(x, y) is True
-            for y in range(height):
-                for x in range(width):
-                    assert sut.get_pixel(x, y) is True
+    def test_refresh_witchout_callback(self) -> None:
+        sut = Display(width=randint(1, 32), height=randint(1, 16))
 
-            for y in range(height):
-                for x in range(width):
-                    assert sut.get_pixel(x, y) is True
-                    sut.set_pixel(x, y, False)
-                    assert sut.get_pixel(x, y) is False
-            for y in range(height):
-                for x in range(width):
-                    assert sut.get_pixel(x, y) is False
+        sut.refresh()
 
-    def test_read_off_screen_pixel(self) -> None:
-        for _ in range(10):
-            width = randint(1, 32)
-            height = randint(1, 16)
+    @pytest.mark.parametrize(('width', 'height'), SIZES)
+    def test_read_write_pixel(self, width: int, height: int) -> None:
+        sut = Display(width=width, height=height)
+        all_off = '\n'.join(Display.PIXEL_OFF * width for _ in range(height))
+        all_on = '\n'.join(Display.PIXEL_ON * width for _ in range(height))
 
-            sut = Display(width=width, height=height)
+        assert str(sut) == all_off
 
-            for y in range(height):
-                for x in range(width):
-                    assert sut.get_pixel(x + width, y) is False
-                    assert sut.get_pixel(x, y + height) is False
-                    assert sut.get_pixel(x + width, y + height) is False
-                    sut.set_pixel(x, y, True)
-                    assert sut.get_pixel(x + width, y) is True
-                    assert sut.get_pixel(x, y + height) is True
-                    assert sut.get_pixel(x + width, y + height) is True
-
-    def test_write_off_screen_pixel(self) -> None:
-        for _ in range(10):
-            width = randint(1, 32)
-            height = randint(1, 16)
+        for y in range(height):
+            for x in range(width):
+                sut.set_pixel(x, y, True)
+        assert str(sut) == all_on
 
-            sut = Display(width=width, height=height)
+        for y in range(height):
+            for x in range(width):
+                sut.set_pixel(x, y, False)
+        assert str(sut) == all_off
 
-            for y in range(height):
-                for x in range(width):
-                    sut.set_pixel(x + width, y, True)
-                    assert sut.get_pixel(x, y) is True
-                    sut.set_pixel(x, y, False)
+    @pytest.mark.parametrize(('width', 'height'), SIZES)
+    def test_read_off_screen_pixel(self, width: int, height: int) -> None:
+        sut = Display(width=width, height=height)
 
-                    sut.set_pixel(x, y + height, True)
-                    assert sut.get_pixel(x, y) is True
-                    sut.set_pixel(x, y, False)
+        for x, y in ((0, 0), (width - 1, 0), (0, height - 1), (width - 1, height - 1), (width // 2, height // 2)):
+            assert sut.get_pixel(x + width, y) is False
+            assert sut.get_pixel(x, y + height) is False
+            assert sut.get_pixel(x + width, y + height) is False
+            sut.set_pixel(x, y, True)
+            assert sut.get_pixel(x + width, y) is True
+            assert sut.get_pixel(x, y + height) is True
+            assert sut.get_pixel(x + width, y + height) is True
+            sut.set_pixel(x, y, False)
+
+    @pytest.mark.parametrize(('width', 'height'), SIZES)
+    def test_write_off_screen_pixel(self, width: int, height: int) -> None:
+        sut = Display(width=width, height=height)
 
-                    sut.set_pixel(x + width, y + height, True)
-                    assert sut.get_pixel(x, y) is True
+        for x, y in ((0, 0), (width - 1, 0), (0, height - 1), (width - 1, height - 1), (width // 2, height // 2)):
+            sut.set_pixel(x + width, y, True)
+            assert sut.get_pixel(x, y) is True
+            sut.set_pixel(x, y, False)
+
+            sut.set_pixel(x, y + height, True)
+            assert sut.get_pixel(x, y) is True
+            sut.set_pixel(x, y, False)
+
+            sut.set_pixel(x + width, y + height, True)
+            assert sut.get_pixel(x, y) is True
+            sut.set_pixel(x, y, False)
 
     def test_flipped_pixel(self) -> None:
         for _ in range(10):
@@ -229,7 +290,7 @@ class TestDisplay:
             y = randint(0, height - 1)
             value = choice([True, False])
 
-            mock_callback = MagicMock(spec_set=Callable)
+            mock_callback = MagicMock()
 
             sut = Display(width=width, height=height)
             sut.set_update_pixel_callback(mock_callback)
@@ -250,17 +311,18 @@ class TestDisplay:
             pixels = {
                 ((x + x2) % width, (y + y2) % height)
                 for y2, line in enumerate(sprite)
-                for x2, pixel in enumerate(f'{line:08b}')
-                if pixel == '1'
+                for x2 in range(8)
+                if line >> (7 - x2) & 1
             }
 
             sut = Display(width=width, height=height)
 
             assert sut.draw_sprite(x, y, sprite) is False
 
-            for y in range(height):
-                for x in range(width):
-                    assert sut.get_pixel(x, y) is ((x, y) in pixels)
+            assert str(sut) == '\n'.join(
+                ''.join(Display.PIXEL_ON if (x, y) in pixels else Display.PIXEL_OFF for x in range(width))
+                for y in range(height)
+            )
 
     def test_draw_sprite_with_collision(self) -> None:
         for _ in range(10):
@@ -279,9 +341,10 @@ class TestDisplay:
             assert sut.draw_sprite(x1, y1, sprite) is False
             assert sut.draw_sprite(x2, y2, sprite) is True
 
-            for y in range(height):
-                for x in range(width):
-                    assert sut.get_pixel(x, y) is ((x, y) in pixels)
+            assert str(sut) == '\n'.join(
+                ''.join(Display.PIXEL_ON if (x, y) in pixels else Display.PIXEL_OFF for x in range(width))
+                for y in range(height)
+            )
 
 
 class TestAddressableDisplay:
@@ -319,11 +382,9 @@ class TestAddressableDisplay:
             address = randint(0, ceil(width * height / 8))
 
             display = Display(width=width, height=height)
+            bits = BITS[value]
             for i, pixel_number in enumerate(range(address * 8, (address + 1) * 8)):
-                pixel = bool(value >> (7 - i) & 1)
-                x = pixel_number % width
-                y = pixel_number // width
-                display.set_pixel(x, y, pixel)
+                display.set_pixel(pixel_number % width, pixel_number // width, bool(bits[i]))
             sut = AddressableDisplay(display)
 
             assert sut[address] == value
@@ -334,10 +395,11 @@ class TestAddressableDisplay:
             height = randint(4, 16)
             value = randint(0, 255)
             address = randint(0, ceil(width * height / 8))
+            bits = BITS[value]
             pixels = {
                 (pixel_number % width, pixel_number // width % height)
                 for i, pixel_number in enumerate(range(address * 8, (address + 1) * 8))
-                if bool(value >> (7 - i) & 1)
+                if bits[i]
             }
 
             display = Display(width=width, height=height)
@@ -345,6 +407,7 @@ class TestAddressableDisplay:
 
             sut[address] = value
 
-            for y in range(height):
-                for x in range(width):
-                    assert display.get_pixel(x, y) is ((x, y) in pixels)
+            assert str(display) == '\n'.join(
+                ''.join(Display.PIXEL_ON if (x, y) in pixels else Display.PIXEL_OFF for x in range(width))
+                for y in range(height)
+            )
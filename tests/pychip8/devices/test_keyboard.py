@@ -1,16 +1,23 @@
-from random import choices
+from os import environ
+from random import Random
 
 import pytest
 
 from pychip8.devices.keyboard import Key, Keyboard
 
+_rng = Random(int(environ.get('PYCHIP8_TEST_SEED', '0')))
+ALL_KEYS = list(Key)
+NUM_KEYS = len(ALL_KEYS)
+KEY_PRESSED_REPRS = {key: f'Keyboard(pressed="{key.name.removeprefix("KEY")}")' for key in ALL_KEYS}
+ALL_KEYS_PRESSED_REPR = f'Keyboard(pressed="{", ".join(key.name.removeprefix("KEY") for key in ALL_KEYS)}")'
+
 
 class TestKey:
     def test_count_keys(self) -> None:
         assert len(Key) == 16
 
     def test_keys(self) -> None:
-        for i in range(len(Key)):
+        for i in range(NUM_KEYS):
             sut = Key(i)
             assert sut.name == f'KEY{i:X}'
             assert sut.value == i
@@ -22,24 +29,24 @@ class TestKeyboard:
 
         assert repr(sut) == 'Keyboard(pressed="")'
 
-    @pytest.mark.parametrize('key', Key)
+    @pytest.mark.parametrize('key', ALL_KEYS)
     def test_repr_with_key_pressed(self, key: Key) -> None:
         sut = Keyboard()
         sut[key] = True
 
-        assert repr(sut) == f'Keyboard(pressed="{key.name.removeprefix("KEY")}")'
+        assert repr(sut) == KEY_PRESSED_REPRS[key]
 
     def test_repr_with_all_keys_pressed(self) -> None:
         sut = Keyboard()
         for k in Key:
             sut[k] = True
 
-        assert repr(sut) == f'Keyboard(pressed="{", ".join(key.name.removeprefix("KEY") for key in Key)}")'
+        assert repr(sut) == ALL_KEYS_PRESSED_REPR
 
     def test_keyboard_size(self) -> None:
         sut = Keyboard()
 
-        assert len(sut) == len(Key)
+        assert len(sut) == NUM_KEYS
 
     def test_keyboard_start_without_key_pressed(self) -> None:
         sut = Keyboard()
@@ -47,7 +54,7 @@ class TestKeyboard:
         for k in Key:
             assert sut[k] is False
 
-    @pytest.mark.parametrize('key', Key)
+    @pytest.mark.parametrize('key', ALL_KEYS)
     def test_press_one_key(self, key: Key) -> None:
         sut = Keyboard()
 
@@ -59,22 +66,22 @@ class TestKeyboard:
         for k in Key:
             assert sut[k] is False
 
-    @pytest.mark.parametrize('key', Key)
+    @pytest.mark.parametrize('key', ALL_KEYS)
     def test_double_press_same_key(self, key: Key) -> None:
+        only_key_pressed = tuple(k == key for k in ALL_KEYS)
+        none_pressed = (False,) * NUM_KEYS
+
         sut = Keyboard()
 
         sut[key] = True
         sut[key] = True
-        for k in Key:
-            assert sut[k] is (k == key)
+        assert tuple(sut[k] for k in ALL_KEYS) == only_key_pressed
 
         sut[key] = False
-        for k in Key:
-            assert sut[k] is False
+        assert tuple(sut[k] for k in ALL_KEYS) == none_pressed
 
         sut[key] = False
-        for k in Key:
-            assert sut[k] is False
+        assert tuple(sut[k] for k in ALL_KEYS) == none_pressed
 
     def test_press_all_keys(self) -> None:
         sut = Keyboard()
@@ -93,73 +100,37 @@ class TestKeyboard:
         for k in Key:
             assert sut[k] is False
 
-    @pytest.mark.parametrize('key', Key)
-    def test_next_key_pressed(self, key: Key) -> None:
-        sut = Keyboard()
-        key_pressed = sut.next_key_pressed()
+    def test_set_pressed_mask(self) -> None:
+        for _ in range(10):
+            keys = set(_rng.choices(ALL_KEYS, k=_rng.randint(1, NUM_KEYS)))
 
-        assert key_pressed.done() is False
+            sut = Keyboard()
+            sut.set_pressed_mask(sum(1 << key for key in keys))
 
-        sut[key] = True
-        assert key_pressed.done() is True
-        assert key_pressed.result() == key
+            for k in Key:
+                assert sut[k] is (k in keys)
 
-    @pytest.mark.parametrize('key', Key)
-    def test_next_key_pressed_not_result_key_up(self, key: Key) -> None:
+            sut.set_pressed_mask(0)
+            for k in Key:
+                assert sut[k] is False
+
+    @pytest.mark.parametrize('key', ALL_KEYS)
+    def test_first_pressed_key(self, key: Key) -> None:
         sut = Keyboard()
-        key_pressed = sut.next_key_pressed()
 
-        sut[key] = False
-        assert key_pressed.done() is False
+        assert sut.first_pressed_key() is None
 
         sut[key] = True
-        assert key_pressed.done() is True
-        assert key_pressed.result() == key
-
-    def test_next_key_pressed_should_return_first_key_pressed(self) -> None:
-        for _ in range(10):
-            key1, key2 = choices(list(Key), k=2)
+        assert sut.first_pressed_key() == key
 
-            sut = Keyboard()
-            key_pressed = sut.next_key_pressed()
-
-            sut[key1] = True
-            sut[key2] = True
-            assert key_pressed.done() is True
-            assert key_pressed.result() == key1
-
-    def test_next_key_pressed_should_resolve_all_futures_with_fist_key_pressed(self) -> None:
-        for _ in range(10):
-            key1, key2 = choices(list(Key), k=2)
+        sut[key] = False
+        assert sut.first_pressed_key() is None
 
+    def test_first_pressed_key_should_return_lowest_key(self) -> None:
+        keys = iter(_rng.choices(ALL_KEYS, k=20))
+        for key1, key2 in zip(keys, keys, strict=False):
             sut = Keyboard()
-            key_pressed1 = sut.next_key_pressed()
-            key_pressed2 = sut.next_key_pressed()
-
             sut[key1] = True
-            assert key_pressed1.done() is True
-            assert key_pressed1.result() == key1
-            assert key_pressed2.done() is True
-            assert key_pressed2.result() == key1
-
-            key_pressed3 = sut.next_key_pressed()
-
             sut[key2] = True
-            assert key_pressed3.done() is True
-            assert key_pressed3.result() == key2
-
-    @pytest.mark.parametrize('key', Key)
-    @pytest.mark.parametrize('i', [0, 1])
-    def test_cancel_one_next_key_pressed_should_not_cancel_the_other(self, key: Key, i: int) -> None:
-        j = (i + 1) % 2
-        sut = Keyboard()
-        key_pressed = [sut.next_key_pressed(), sut.next_key_pressed()]
-
-        key_pressed[i].cancel()
-        sut[key] = True
-
-        assert key_pressed[i].cancelled() is True
 
-        assert key_pressed[j].cancelled() is False
-        assert key_pressed[j].done() is True
-        assert key_pressed[j].result() == key
+            assert sut.first_pressed_key() == min(key1, key2)
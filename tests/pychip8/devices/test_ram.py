@@ -1,54 +1,60 @@
-from random import randint
+from os import environ
+from random import Random
+
+import pytest
 
 from pychip8.devices.ram import Ram
 
+_rng = Random(int(environ.get('PYCHIP8_TEST_SEED', '0')))
+SIZES = [_rng.randint(1, 4096) for _ in range(10)]
+SMALL_SIZES = [_rng.randint(1, 128) for _ in range(10)]
 
-class TestRam:
-    def test_repr(self) -> None:
-        for _ in range(10):
-            size = randint(1, 4096)
 
-            sut = Ram(size=size)
+@pytest.fixture(params=SMALL_SIZES)
+def small_ram(request: pytest.FixtureRequest) -> Ram:
+    return Ram(size=request.param)
+
 
-            assert repr(sut) == f'Ram(size={size})'
+class TestRam:
+    @pytest.mark.parametrize('size', SIZES)
+    def test_repr(self, size: int) -> None:
+        sut = Ram(size=size)
 
-    def test_length(self) -> None:
-        for _ in range(10):
-            size = randint(1, 4096)
+        assert repr(sut) == f'Ram(size={size})'
 
-            sut = Ram(size=size)
+    @pytest.mark.parametrize('size', SIZES)
+    def test_length(self, size: int) -> None:
+        sut = Ram(size=size)
 
-            assert len(sut) == size
+        assert len(sut) == size
 
     def test_ran_should_start_with_zero(self) -> None:
-        size = randint(64, 128)
+        size = _rng.randint(64, 128)
 
         sut = Ram(size=size)
 
-        for i in range(len(sut)):
-            assert sut[i] == 0
+        assert bytes(sut.view) == bytes(size)
 
-    def test_read_write_addresses(self) -> None:
-        for _ in range(10):
-            sut = Ram(size=randint(1, 128))
+    def test_read_write_addresses(self, small_ram: Ram) -> None:
+        sut = small_ram
+        size = len(sut)
+        expected = bytes(range(size))
 
-            for i in range(len(sut)):
-                assert sut[i] == 0
-                sut[i] = i
-                assert sut[i] == i
-            for i in range(len(sut)):
-                assert sut[i] == i
+        assert bytes(sut.view) == bytes(size)
+        for i in range(size):
+            sut[i] = i
+            assert sut[i] == i
+        assert bytes(sut.view) == expected
 
-            for i in range(len(sut)):
-                assert sut[i] == i
-                sut[i] = 0
-                assert sut[i] == 0
-            for i in range(len(sut)):
-                assert sut[i] == 0
+        for i in range(size):
+            sut[i] = 0
+            assert sut[i] == 0
+        assert bytes(sut.view) == bytes(size)
 
     def test_write_overflow(self) -> None:
         sut = Ram(size=0xFF)
 
         for i in range(len(sut)):
             sut[i] = i + 0x100
-            assert sut[i] == i
+
+        assert bytes(sut.view) == bytes(range(0xFF))
@@ -1,53 +1,53 @@
-from random import randint
+from os import environ
+from random import Random
 
 import pytest
 
 from pychip8.devices.rom import Rom
 
+MINIMUM_SIZE = 16 * 5
+_rng = Random(int(environ.get('PYCHIP8_TEST_SEED', '0')))
+SIZES = [_rng.randint(MINIMUM_SIZE, MINIMUM_SIZE * 2) for _ in range(10)]
+SMALL_SIZES = [_rng.randint(1, MINIMUM_SIZE - 1) for _ in range(10)]
+SPRITES_FLAT = bytes(byte for sprite in Rom.SPRITES for byte in sprite)
 
-class TestRom:
-    MINIMUM_SIZE = 16 * 5
 
-    def test_repr(self) -> None:
-        for _ in range(10):
-            size = randint(self.MINIMUM_SIZE, self.MINIMUM_SIZE * 2)
+class TestRom:
+    MINIMUM_SIZE = MINIMUM_SIZE
 
-            sut = Rom(size=size)
+    @pytest.mark.parametrize('size', SIZES)
+    def test_repr(self, size: int) -> None:
+        sut = Rom(size=size)
 
-            assert repr(sut) == f'Rom(size={size})'
+        assert repr(sut) == f'Rom(size={size})'
 
-    def test_length_larger_than_minimum_size(self) -> None:
-        for _ in range(10):
-            size = randint(self.MINIMUM_SIZE, self.MINIMUM_SIZE * 2)
-
-            sut = Rom(size=size)
+    @pytest.mark.parametrize('size', SIZES)
+    def test_length_larger_than_minimum_size(self, size: int) -> None:
+        sut = Rom(size=size)
 
-            assert len(sut) == size
+        assert len(sut) == size
 
-    def test_length_should_be_the_minimum_size(self) -> None:
-        for _ in range(10):
-            sut = Rom(size=randint(1, self.MINIMUM_SIZE - 1))
+    @pytest.mark.parametrize('size', SMALL_SIZES)
+    def test_length_should_be_the_minimum_size(self, size: int) -> None:
+        sut = Rom(size=size)
 
-            assert len(sut) == self.MINIMUM_SIZE
+        assert len(sut) == self.MINIMUM_SIZE
 
-    @pytest.mark.parametrize('i', range(16))
-    def test_read_sprite(self, i: int) -> None:
-        sut = Rom(size=randint(self.MINIMUM_SIZE, self.MINIMUM_SIZE * 2))
+    def test_read_sprites(self) -> None:
+        sut = Rom(size=_rng.randint(self.MINIMUM_SIZE, self.MINIMUM_SIZE * 2))
 
-        for n in range(5):
-            assert sut[i * 5 + n] == Rom.SPRITES[i][n]
+        assert bytes(sut.view[: self.MINIMUM_SIZE]) == SPRITES_FLAT
 
     def test_read_zeros(self) -> None:
-        size = randint(self.MINIMUM_SIZE, self.MINIMUM_SIZE * 2)
+        size = _rng.randint(self.MINIMUM_SIZE, self.MINIMUM_SIZE * 2)
 
         sut = Rom(size=size)
 
-        for i in range(self.MINIMUM_SIZE, size):
-            assert sut[i] == 0
+        assert bytes(sut.view[self.MINIMUM_SIZE :]) == bytes(size - self.MINIMUM_SIZE)
 
     def test_write_should_raise_error(self) -> None:
         sut = Rom(size=self.MINIMUM_SIZE)
 
         for _ in range(10):
             with pytest.raises(RuntimeError, match='^Writing on ROM$'):
-                sut[randint(0, self.MINIMUM_SIZE)] = 0
+                sut[_rng.randint(0, self.MINIMUM_SIZE)] = 0
@@ -1,36 +1,106 @@
 from itertools import count
-from random import randint
+from os import environ
+from random import Random
 from time import monotonic_ns, sleep
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
-from pychip8.clock import Tickable, clock
+import pytest
+
+from pychip8.clock import clock, run_clock
+
+_rng = Random(int(environ.get('PYCHIP8_TEST_SEED', '0')))
+
+
+class FakeTickable:
+    __slots__ = ('count',)
+
+    def __init__(self) -> None:
+        self.count = 0
+
+    def tick(self) -> None:
+        self.count += 1
+
+
+_mock_sleep = MagicMock(spec_set=sleep)
+_mock_monotonic = MagicMock(spec_set=monotonic_ns)
+
+
+@pytest.fixture
+def clock_mocks(monkeypatch: pytest.MonkeyPatch) -> tuple[MagicMock, MagicMock]:
+    _mock_sleep.reset_mock(return_value=True, side_effect=True)
+    _mock_monotonic.reset_mock(return_value=True, side_effect=True)
+    monkeypatch.setattr('pychip8.clock.sleep', _mock_sleep)
+    monkeypatch.setattr('pychip8.clock.monotonic_ns', _mock_monotonic)
+    return _mock_sleep, _mock_monotonic
 
 
 class TestClock:
-    @patch('pychip8.clock.monotonic_ns', spec_set=monotonic_ns)
-    @patch('pychip8.clock.sleep', spec_set=sleep)
-    def test_run_without_sleep(self, mock_sleep: MagicMock, mock_monotonic: MagicMock) -> None:
+    def test_run_without_sleep(self, clock_mocks: tuple[MagicMock, MagicMock]) -> None:
+        mock_sleep, mock_monotonic = clock_mocks
         mock_monotonic.side_effect = count(start=1000, step=1000)
-        mock_tickable = MagicMock(spec_set=Tickable)
+        tickable = FakeTickable()
 
-        sut = clock(mock_tickable, 1_000_000)
+        sut = clock(tickable, 1_000_000)
 
-        for i in range(1, randint(10, 50)):
+        for i in range(1, 6):
             next(sut)
 
-            assert mock_tickable.tick.call_count == i
+            assert tickable.count == i
             mock_sleep.assert_not_called()
 
-    @patch('pychip8.clock.monotonic_ns', spec_set=monotonic_ns)
-    @patch('pychip8.clock.sleep', spec_set=sleep)
-    def test_run_with_sleep(self, mock_sleep: MagicMock, mock_monotonic: MagicMock) -> None:
+    def test_run_with_sleep(self, clock_mocks: tuple[MagicMock, MagicMock]) -> None:
+        mock_sleep, mock_monotonic = clock_mocks
         mock_monotonic.return_value = 0
-        mock_tickable = MagicMock(spec_set=Tickable)
+        tickable = FakeTickable()
 
-        sut = clock(mock_tickable, 1_000_000)
+        sut = clock(tickable, 1_000_000)
 
-        for i in range(1, randint(10, 50)):
+        for i in range(1, 6):
             next(sut)
 
-            assert mock_tickable.tick.call_count == i
+            assert tickable.count == i
             assert mock_sleep.call_count == i
+
+    def test_run_with_batch(self, clock_mocks: tuple[MagicMock, MagicMock]) -> None:
+        mock_sleep, mock_monotonic = clock_mocks
+        mock_monotonic.return_value = 0
+        tickable = FakeTickable()
+        batch = _rng.randint(2, 16)
+
+        sut = clock(tickable, 1_000_000, batch=batch)
+
+        for i in range(1, 6):
+            next(sut)
+
+            assert tickable.count == i
+            assert mock_sleep.call_count == (i + batch - 1) // batch
+
+
+class TestRunClock:
+    def test_run_until_on_tick_stops(self, clock_mocks: tuple[MagicMock, MagicMock]) -> None:
+        mock_sleep, mock_monotonic = clock_mocks
+        mock_monotonic.return_value = 0
+        tickable = FakeTickable()
+        ticks = 6
+        mock_on_tick = MagicMock()
+        mock_on_tick.side_effect = [True] * (ticks - 1) + [False]
+
+        run_clock(tickable, 1_000_000, mock_on_tick)
+
+        assert tickable.count == ticks
+        assert mock_on_tick.call_count == ticks
+        assert mock_sleep.call_count == ticks
+
+    def test_run_with_batch(self, clock_mocks: tuple[MagicMock, MagicMock]) -> None:
+        mock_sleep, mock_monotonic = clock_mocks
+        mock_monotonic.return_value = 0
+        tickable = FakeTickable()
+        batch = _rng.randint(2, 16)
+        ticks = 6
+        mock_on_tick = MagicMock()
+        mock_on_tick.side_effect = [True] * (ticks - 1) + [False]
+
+        run_clock(tickable, 1_000_000, mock_on_tick, batch=batch)
+
+        assert tickable.count == ticks
+        assert mock_sleep.call_count == (ticks + batch - 1) // batch
@@ -1,7 +1,8 @@
-from asyncio import Future
-from collections.abc import Callable
+from collections.abc import Sequence
 from dataclasses import dataclass
-from random import choice, randint
+from itertools import product
+from os import environ
+from random import Random
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -10,17 +11,81 @@ from pychip8.core import Chip8Core
 from pychip8.devices.devicebus import DeviceBus
 from pychip8.devices.display import Display
 from pychip8.devices.keyboard import Key, Keyboard
+from pychip8.devices.ram import Ram
+
+_rng = Random(int(environ.get('PYCHIP8_TEST_SEED', '0')))
+_x_bytes = iter(_rng.randbytes(3 * 10))
+X_CASES = [(((hi << 8) | lo) % 0xFFF, b & 0xF) for hi, lo, b in zip(_x_bytes, _x_bytes, _x_bytes, strict=True)]
+_pair_bytes = iter(_rng.randbytes(2 * 15 * 15))
+VALUE_PAIRS = list(zip(_pair_bytes, _pair_bytes, strict=True))
+REGISTER_PAIR_CASES = [
+    (x, y, value1, value2) for (x, y), (value1, value2) in zip(product(range(15), repeat=2), VALUE_PAIRS, strict=True)
+]
+REGISTER_VALUE_CASES = [(x, y, value1) for x, y, value1, _ in REGISTER_PAIR_CASES]
+
+
+DECODE_CASES = [
+    pytest.param(0x0000, '_instruction_sys', ('nnn',), id='sys'),
+    pytest.param(0x00E0, '_instruction_cls', (), id='cls'),
+    pytest.param(0x00EE, '_instruction_rts', (), id='rts'),
+    pytest.param(0x1000, '_instruction_jump', ('nnn',), id='jump'),
+    pytest.param(0x2000, '_instruction_call', ('nnn',), id='call'),
+    pytest.param(0x3000, '_instruction_skip_eq_imediate', ('x', 'nn'), id='skip_eq_imediate'),
+    pytest.param(0x4000, '_instruction_skip_ne_imediate', ('x', 'nn'), id='skip_ne_imediate'),
+    pytest.param(0x5000, '_instruction_skip_eq_register', ('x', 'y'), id='skip_eq_register'),
+    pytest.param(0x6000, '_instruction_mov_imediate', ('x', 'nn'), id='mov_imediate'),
+    pytest.param(0x7000, '_instruction_add_imediate', ('x', 'nn'), id='add_imediate'),
+    pytest.param(0x8000, '_instruction_mov_register', ('x', 'y'), id='mov_register'),
+    pytest.param(0x8001, '_instruction_or', ('x', 'y'), id='or'),
+    pytest.param(0x8002, '_instruction_and', ('x', 'y'), id='and'),
+    pytest.param(0x8003, '_instruction_xor', ('x', 'y'), id='xor'),
+    pytest.param(0x8004, '_instruction_add_register', ('x', 'y'), id='add_register'),
+    pytest.param(0x8005, '_instruction_sub', ('x', 'y'), id='sub'),
+    pytest.param(0x8006, '_instruction_shr', ('x', 'y'), id='shr'),
+    pytest.param(0x8007, '_instruction_subb', ('x', 'y'), id='subb'),
+    pytest.param(0x800E, '_instruction_shl', ('x', 'y'), id='shl'),
+    pytest.param(0x9000, '_instruction_skip_ne_register', ('x', 'y'), id='skip_ne_register'),
+    pytest.param(0xA000, '_instruction_mov_to_i', ('nnn',), id='mov_to_i'),
+    pytest.param(0xB000, '_instruction_jump_v0', ('nnn',), id='jump_v0'),
+    pytest.param(0xC000, '_instruction_rnd', ('x', 'nn'), id='rnd'),
+    pytest.param(0xD000, '_instruction_sprite', ('x', 'y', 'n'), id='sprite'),
+    pytest.param(0xE09E, '_instruction_skip_key', ('x',), id='skip_key'),
+    pytest.param(0xE0A1, '_instruction_skip_nokey', ('x',), id='skip_nokey'),
+    pytest.param(0xF007, '_instruction_mov_from_delay', ('x',), id='mov_from_delay'),
+    pytest.param(0xF00A, '_instruction_wait_key', ('x',), id='wait_key'),
+    pytest.param(0xF015, '_instruction_mov_to_delay', ('x',), id='mov_to_delay'),
+    pytest.param(0xF018, '_instruction_mov_to_sound', ('x',), id='mov_to_sound'),
+    pytest.param(0xF01E, '_instruction_add_to_i', ('x',), id='add_to_i'),
+    pytest.param(0xF029, '_instruction_spritechar', ('x',), id='spritechar'),
+    pytest.param(0xF033, '_instruction_movbcd', ('x',), id='movbcd'),
+    pytest.param(0xF055, '_instruction_movm_to_i', ('x',), id='movm_to_i'),
+    pytest.param(0xF065, '_instruction_movm_from_i', ('x',), id='movm_from_i'),
+]
+OPERAND_SHIFTS = {'x': 8, 'y': 4, 'n': 0, 'nn': 0, 'nnn': 0}
+OPERAND_CASES: list[tuple[int, int, int, int, int, int]] = []
+while len(OPERAND_CASES) < 10:
+    b0, b1, b2, b3, b4, b5 = _rng.randbytes(6)
+    nnn = ((b3 >> 4) << 8) | b5
+    if nnn in (0x00E0, 0x00EE):
+        continue
+    OPERAND_CASES.append((((b0 << 8) | b1) % 0xFFF, b2 >> 4, b2 & 0xF, b3 & 0xF, b4, nnn))
+
+_ZERO_MEMORY = bytes(4096)
+
+
+def _write_instruction(memory: bytearray, address: int, instruction: int, /) -> None:
+    memory[address : address + 2] = (instruction >> 8, instruction & 0xFF)
 
 
 @dataclass
 class MockBus:
-    bus: DeviceBus
-    memory: list[int]
+    bus: MagicMock
+    memory: bytearray
 
 
-@pytest.fixture
+@pytest.fixture(scope='class')
 def mock_bus() -> MockBus:
-    memory = [0 for _ in range(4096)]
+    memory = bytearray(4096)
 
     def read(x: int) -> int:
         return memory[x]
@@ -28,23 +93,115 @@ def mock_bus() -> MockBus:
     def write(x: int, y: int) -> None:
         memory[x] = y
 
+    def read_bytes(x: int, length: int) -> bytes:
+        return bytes(memory[x : x + length])
+
+    def write_bytes(x: int, data: bytes) -> None:
+        memory[x : x + len(data)] = data
+
     mock_bus = MagicMock(spec_set=DeviceBus)
     mock_bus.__getitem__.side_effect = read
     mock_bus.__setitem__.side_effect = write
+    mock_bus.read_bytes.side_effect = read_bytes
+    mock_bus.write_bytes.side_effect = write_bytes
 
     return MockBus(mock_bus, memory)
 
 
+class StubDisplay(Display):
+    __slots__ = ('clear_calls', 'draw_calls', 'flipped')
+
+    def __init__(self) -> None:
+        super().__init__(width=64, height=32)
+        self.clear_calls = 0
+        self.draw_calls: list[tuple[int, int, bytes]] = []
+        self.flipped = False
+
+    def clear(self) -> None:
+        self.clear_calls += 1
+
+    def draw_sprite(self, x: int, y: int, sprite: Sequence[int], /) -> bool:
+        self.draw_calls.append((x, y, bytes(sprite)))
+        return self.flipped
+
+
+class StubKeyboard(Keyboard):
+    __slots__ = ('first_key', 'pressed')
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.pressed = False
+        self.first_key: Key | None = None
+
+    def __getitem__(self, key: int, /) -> bool:
+        return self.pressed
+
+    def first_pressed_key(self) -> Key | None:
+        return self.first_key
+
+
+class Recorder:
+    __slots__ = ('calls',)
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[int, ...]] = []
+
+    def __call__(self, *args: int) -> None:
+        self.calls.append(args)
+
+
+@dataclass
+class MockCore:
+    core: Chip8Core
+    display: StubDisplay
+    keyboard: StubKeyboard
+
+
+@pytest.fixture(autouse=True)
+def _reset_bus(mock_bus: MockBus) -> None:
+    mock_bus.memory[:] = _ZERO_MEMORY
+    mock_bus.bus.reset_mock()
+
+
+_mock_device_bus = MagicMock(spec_set=DeviceBus)
+_mock_display = MagicMock(spec_set=Display)
+_mock_keyboard = MagicMock(spec_set=Keyboard)
+
+_mock_randbits = MagicMock()
+
+
+@pytest.fixture
+def mock_randbits(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    _mock_randbits.reset_mock(return_value=True, side_effect=True)
+    monkeypatch.setattr('pychip8.core.getrandbits', _mock_randbits)
+    return _mock_randbits
+
+
+@pytest.fixture
+def mock_core(mock_bus: MockBus) -> MockCore:
+    display = StubDisplay()
+    keyboard = StubKeyboard()
+    core = Chip8Core(
+        bus=mock_bus.bus,
+        reserved_address=352,
+        display=display,
+        keyboard=keyboard,
+        entrypoint=0x200,
+        instructions_per_update=16,
+    )
+    return MockCore(core, display, keyboard)
+
+
 class TestChip8Core:
     def test_repr(self) -> None:
         for _ in range(10):
-            pc = randint(0, 4096)
+            pc = _rng.randint(0, 4096)
 
             sut = Chip8Core(
-                bus=MagicMock(spec_set=DeviceBus),
+                bus=_mock_device_bus,
                 reserved_address=0,
-                display=MagicMock(spec_set=Display),
-                keyboard=MagicMock(spec_set=Keyboard),
+                display=_mock_display,
+                keyboard=_mock_keyboard,
                 entrypoint=pc,
                 instructions_per_update=16,
             )
@@ -53,20 +210,20 @@ class TestChip8Core:
 
     def test_tick(self) -> None:
         for _ in range(10):
-            instructions_per_update = randint(1, 16)
+            instructions_per_update = _rng.randint(1, 16)
 
             sut = Chip8Core(
-                bus=MagicMock(spec_set=DeviceBus),
+                bus=_mock_device_bus,
                 reserved_address=0,
-                display=MagicMock(spec_set=Display),
-                keyboard=MagicMock(spec_set=Keyboard),
+                display=_mock_display,
+                keyboard=_mock_keyboard,
                 entrypoint=0x200,
                 instructions_per_update=instructions_per_update,
             )
 
             with (
-                patch.object(sut, '_execute_instruction', spec_set=Callable) as mock_execute_instruction,
-                patch.object(sut, '_decrement_timer', spec_set=Callable) as mock_decrement_time,
+                patch.object(sut, '_execute_instruction') as mock_execute_instruction,
+                patch.object(sut, '_decrement_timer') as mock_decrement_time,
             ):
                 for i in range(1, instructions_per_update * 3 + 1):
                     sut.tick()
@@ -76,16 +233,16 @@ class TestChip8Core:
 
     def test_callbacks_in_tick(self) -> None:
         for _ in range(10):
-            instructions_per_update = randint(1, 16)
+            instructions_per_update = _rng.randint(1, 16)
 
-            mock_tick_callback = MagicMock(spec_set=Callable)
-            mock_update_callback = MagicMock(spec_set=Callable)
+            mock_tick_callback = MagicMock()
+            mock_update_callback = MagicMock()
 
             sut = Chip8Core(
-                bus=MagicMock(spec_set=DeviceBus),
+                bus=_mock_device_bus,
                 reserved_address=0,
-                display=MagicMock(spec_set=Display),
-                keyboard=MagicMock(spec_set=Keyboard),
+                display=_mock_display,
+                keyboard=_mock_keyboard,
                 entrypoint=0x200,
                 instructions_per_update=instructions_per_update,
             )
@@ -93,8 +250,8 @@ class TestChip8Core:
             sut.set_update_callback(mock_update_callback)
 
             with (
-                patch.object(sut, '_execute_instruction', spec_set=Callable),
-                patch.object(sut, '_decrement_timer', spec_set=Callable),
+                patch.object(sut, '_execute_instruction'),
+                patch.object(sut, '_decrement_timer'),
             ):
                 for i in range(1, instructions_per_update * 3 + 1):
                     sut.tick()
@@ -104,10 +261,10 @@ class TestChip8Core:
 
     def test_decrement_timers_with_zero(self) -> None:
         sut = Chip8Core(
-            bus=MagicMock(spec_set=DeviceBus),
+            bus=_mock_device_bus,
             reserved_address=0,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
+            display=_mock_display,
+            keyboard=_mock_keyboard,
             entrypoint=0x200,
             instructions_per_update=16,
         )
@@ -121,13 +278,13 @@ class TestChip8Core:
         assert sut._sound_timer == 0
 
     def test_decrement_delay_timer(self) -> None:
-        timer = randint(5, 10)
+        timer = _rng.randint(5, 10)
 
         sut = Chip8Core(
-            bus=MagicMock(spec_set=DeviceBus),
+            bus=_mock_device_bus,
             reserved_address=0,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
+            display=_mock_display,
+            keyboard=_mock_keyboard,
             entrypoint=0x200,
             instructions_per_update=16,
         )
@@ -140,13 +297,13 @@ class TestChip8Core:
             assert sut._sound_timer == 0
 
     def test_decrement_sound_timer(self) -> None:
-        timer = randint(5, 10)
+        timer = _rng.randint(5, 10)
 
         sut = Chip8Core(
-            bus=MagicMock(spec_set=DeviceBus),
+            bus=_mock_device_bus,
             reserved_address=0,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
+            display=_mock_display,
+            keyboard=_mock_keyboard,
             entrypoint=0x200,
             instructions_per_update=16,
         )
@@ -159,13 +316,13 @@ class TestChip8Core:
             assert sut._sound_timer == t
 
     def test_decrement_all_timers(self) -> None:
-        timer = randint(5, 10)
+        timer = _rng.randint(5, 10)
 
         sut = Chip8Core(
-            bus=MagicMock(spec_set=DeviceBus),
+            bus=_mock_device_bus,
             reserved_address=0,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
+            display=_mock_display,
+            keyboard=_mock_keyboard,
             entrypoint=0x200,
             instructions_per_update=16,
         )
@@ -178,104 +335,31 @@ class TestChip8Core:
             assert sut._delay_timer == t
             assert sut._sound_timer == t
 
-    def test_instruction_sys(self) -> None:
-        sut = Chip8Core(
-            bus=MagicMock(spec_set=DeviceBus),
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
+    def test_instruction_sys(self, mock_core: MockCore) -> None:
+        sut = mock_core.core
 
         for _ in range(10):
-            value = randint(0, 0xFFF)
+            value = _rng.randint(0, 0xFFF)
 
             with pytest.raises(NotImplementedError, match=f'^Instruction {value:04x} not implemented$'):
                 sut._instruction_sys(value)
 
-    def test_execute_instruction_sys(self, mock_bus: MockBus) -> None:
-        sut = Chip8Core(
-            bus=mock_bus.bus,
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
-
-        for _ in range(10):
-            address = randint(0, 0xFFE)
-            while True:
-                instruction = randint(0, 0x0FFF)
-                if instruction not in (0x00E0, 0x00EE):
-                    break
-
-            sut._pc = address
-            mock_bus.memory[address] = instruction >> 8
-            mock_bus.memory[address + 1] = instruction & 0xFF
-
-            with patch.object(sut, '_instruction_sys', spec_set=Callable) as mock_instruction:
-                sut._execute_instruction()
-
-                mock_instruction.assert_called_once_with(instruction & 0xFFF)
-                assert sut._pc == address + 2
-
-    def test_instruction_jump(self) -> None:
-        sut = Chip8Core(
-            bus=MagicMock(spec_set=DeviceBus),
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
+    def test_instruction_jump(self, mock_core: MockCore) -> None:
+        sut = mock_core.core
 
         for _ in range(10):
-            address = randint(0, 0xFFF)
+            address = _rng.randint(0, 0xFFF)
 
             sut._instruction_jump(address)
 
             assert sut._pc == address
 
-    def test_execute_instruction_jump(self, mock_bus: MockBus) -> None:
-        sut = Chip8Core(
-            bus=mock_bus.bus,
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
-
-        for _ in range(10):
-            address = randint(0, 0xFFE)
-            op = 1
-            nnn = randint(0, 0xFFF)
-
-            sut._pc = address
-            mock_bus.memory[address] = (op << 4) | (nnn >> 8)
-            mock_bus.memory[address + 1] = nnn & 0xFF
-
-            with patch.object(sut, '_instruction_jump', spec_set=Callable) as mock_instruction:
-                sut._execute_instruction()
-
-                mock_instruction.assert_called_once_with(nnn)
-                assert sut._pc == address + 2
-
-    def test_instruction_jump_v0(self) -> None:
-        sut = Chip8Core(
-            bus=MagicMock(spec_set=DeviceBus),
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
+    def test_instruction_jump_v0(self, mock_core: MockCore) -> None:
+        sut = mock_core.core
 
         for _ in range(10):
-            address = randint(0, 0xF00)
-            v0 = randint(0, 0xFF)
+            address = _rng.randint(0, 0xF00)
+            v0 = _rng.randint(0, 0xFF)
 
             sut._v[0] = v0
 
@@ -283,46 +367,14 @@ class TestChip8Core:
 
             assert sut._pc == address + v0
 
-    def test_execute_instruction_jump_v0(self, mock_bus: MockBus) -> None:
-        sut = Chip8Core(
-            bus=mock_bus.bus,
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
-
-        for _ in range(10):
-            address = randint(0, 0xFFE)
-            op = 0xB
-            nnn = randint(0, 0xFFF)
-
-            sut._pc = address
-            mock_bus.memory[address] = (op << 4) | (nnn >> 8)
-            mock_bus.memory[address + 1] = nnn & 0xFF
-
-            with patch.object(sut, '_instruction_jump_v0', spec_set=Callable) as mock_instruction:
-                sut._execute_instruction()
-
-                mock_instruction.assert_called_once_with(nnn)
-                assert sut._pc == address + 2
-
-    def test_instruction_skip_eq_imediate(self) -> None:
-        sut = Chip8Core(
-            bus=MagicMock(spec_set=DeviceBus),
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
+    def test_instruction_skip_eq_imediate(self, mock_core: MockCore) -> None:
+        sut = mock_core.core
 
         for _ in range(10):
-            address = randint(0, 0xF00)
+            address = _rng.randint(0, 0xF00)
 
             for i in range(16):
-                value = randint(0, 255)
+                value = _rng.randint(0, 255)
 
                 sut._pc = address
                 sut._v[i] = value
@@ -337,48 +389,16 @@ class TestChip8Core:
 
                 assert sut._pc == address
 
-    def test_execute_instruction_skip_eq_imediate(self, mock_bus: MockBus) -> None:
-        sut = Chip8Core(
-            bus=mock_bus.bus,
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
-
-        for _ in range(10):
-            address = randint(0, 0xFFE)
-            op = 3
-            x = randint(0, 15)
-            nn = randint(0, 0xFF)
-
-            sut._pc = address
-            mock_bus.memory[address] = (op << 4) | x
-            mock_bus.memory[address + 1] = nn
-
-            with patch.object(sut, '_instruction_skip_eq_imediate', spec_set=Callable) as mock_instruction:
-                sut._execute_instruction()
-
-                mock_instruction.assert_called_once_with(x, nn)
-                assert sut._pc == address + 2
-
-    def test_instruction_skip_eq_register(self) -> None:
-        sut = Chip8Core(
-            bus=MagicMock(spec_set=DeviceBus),
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
+    def test_instruction_skip_eq_register(self, mock_core: MockCore) -> None:
+        sut = mock_core.core
 
         for _ in range(10):
-            address = randint(0, 0xF00)
+            address = _rng.randint(0, 0xF00)
 
             for i in range(16):
-                j = choice([v for v in range(16) if v != i])
-                value = randint(0, 255)
+                j = _rng.randrange(15)
+                j += j >= i
+                value = _rng.randint(0, 255)
 
                 sut._pc = address
                 sut._v[i] = value
@@ -395,48 +415,14 @@ class TestChip8Core:
 
                 assert sut._pc == address
 
-    def test_execute_instruction_skip_eq_register(self, mock_bus: MockBus) -> None:
-        sut = Chip8Core(
-            bus=mock_bus.bus,
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
-
-        for _ in range(10):
-            address = randint(0, 0xFFE)
-            op = 5
-            x = randint(0, 15)
-            y = randint(0, 15)
-            n = 0
-
-            sut._pc = address
-            mock_bus.memory[address] = (op << 4) | x
-            mock_bus.memory[address + 1] = (y << 4) | n
-
-            with patch.object(sut, '_instruction_skip_eq_register', spec_set=Callable) as mock_instruction:
-                sut._execute_instruction()
-
-                mock_instruction.assert_called_once_with(x, y)
-                assert sut._pc == address + 2
-
-    def test_instruction_skip_ne_imediate(self) -> None:
-        sut = Chip8Core(
-            bus=MagicMock(spec_set=DeviceBus),
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
+    def test_instruction_skip_ne_imediate(self, mock_core: MockCore) -> None:
+        sut = mock_core.core
 
         for _ in range(10):
-            address = randint(0, 0xF00)
+            address = _rng.randint(0, 0xF00)
 
             for i in range(16):
-                value = randint(0, 255)
+                value = _rng.randint(0, 255)
 
                 sut._pc = address
                 sut._v[i] = value
@@ -451,48 +437,16 @@ class TestChip8Core:
 
                 assert sut._pc == address
 
-    def test_execute_instruction_skip_ne_imediate(self, mock_bus: MockBus) -> None:
-        sut = Chip8Core(
-            bus=mock_bus.bus,
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
-
-        for _ in range(10):
-            address = randint(0, 0xFFE)
-            op = 4
-            x = randint(0, 15)
-            nn = randint(0, 0xFF)
-
-            sut._pc = address
-            mock_bus.memory[address] = (op << 4) | x
-            mock_bus.memory[address + 1] = nn
-
-            with patch.object(sut, '_instruction_skip_ne_imediate', spec_set=Callable) as mock_instruction:
-                sut._execute_instruction()
-
-                mock_instruction.assert_called_once_with(x, nn)
-                assert sut._pc == address + 2
-
-    def test_instruction_skip_ne_register(self) -> None:
-        sut = Chip8Core(
-            bus=MagicMock(spec_set=DeviceBus),
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
+    def test_instruction_skip_ne_register(self, mock_core: MockCore) -> None:
+        sut = mock_core.core
 
         for _ in range(10):
-            address = randint(0, 0xF00)
+            address = _rng.randint(0, 0xF00)
 
             for i in range(16):
-                j = choice([v for v in range(16) if v != i])
-                value = randint(0, 255)
+                j = _rng.randrange(15)
+                j += j >= i
+                value = _rng.randint(0, 255)
 
                 sut._pc = address
                 sut._v[i] = value
@@ -509,48 +463,14 @@ class TestChip8Core:
 
                 assert sut._pc == address
 
-    def test_execute_instruction_skip_ne_register(self, mock_bus: MockBus) -> None:
-        sut = Chip8Core(
-            bus=mock_bus.bus,
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
-
-        for _ in range(10):
-            address = randint(0, 0xFFE)
-            op = 9
-            x = randint(0, 15)
-            y = randint(0, 15)
-            n = 0
-
-            sut._pc = address
-            mock_bus.memory[address] = (op << 4) | x
-            mock_bus.memory[address + 1] = (y << 4) | n
-
-            with patch.object(sut, '_instruction_skip_ne_register', spec_set=Callable) as mock_instruction:
-                sut._execute_instruction()
-
-                mock_instruction.assert_called_once_with(x, y)
-                assert sut._pc == address + 2
-
-    def test_instruction_call_and_rts(self, mock_bus: MockBus) -> None:
+    def test_instruction_call_and_rts(self, mock_core: MockCore) -> None:
         for _ in range(10):
-            sut = Chip8Core(
-                bus=mock_bus.bus,
-                reserved_address=352,
-                display=MagicMock(spec_set=Display),
-                keyboard=MagicMock(spec_set=Keyboard),
-                entrypoint=0x200,
-                instructions_per_update=16,
-            )
+            sut = mock_core.core
             addresses = [sut._pc]
             sp = sut._sp
 
             for _ in range(12):
-                address = randint(0, 0xF00)
+                address = _rng.randint(0, 0xF00)
                 addresses.append(address)
                 sp += 2
 
@@ -569,68 +489,12 @@ class TestChip8Core:
                 assert sut._pc == address
                 assert sut._sp == sp
 
-    def test_execute_instruction_call(self, mock_bus: MockBus) -> None:
-        sut = Chip8Core(
-            bus=mock_bus.bus,
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
-
-        for _ in range(10):
-            address = randint(0, 0xFFE)
-            op = 2
-            nnn = randint(0, 0xFFF)
-
-            sut._pc = address
-            mock_bus.memory[address] = (op << 4) | (nnn >> 8)
-            mock_bus.memory[address + 1] = nnn & 0xFF
-
-            with patch.object(sut, '_instruction_call', spec_set=Callable) as mock_instruction:
-                sut._execute_instruction()
-
-                mock_instruction.assert_called_once_with(nnn)
-                assert sut._pc == address + 2
-
-    def test_execute_instruction_rts(self, mock_bus: MockBus) -> None:
-        sut = Chip8Core(
-            bus=mock_bus.bus,
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
-
-        for _ in range(10):
-            address = randint(0, 0xFFE)
-            instruction = 0x00EE
-
-            sut._pc = address
-            mock_bus.memory[address] = instruction >> 8
-            mock_bus.memory[address + 1] = instruction & 0xFF
-
-            with patch.object(sut, '_instruction_rts', spec_set=Callable) as mock_instruction:
-                sut._execute_instruction()
-
-                mock_instruction.assert_called_once_with()
-                assert sut._pc == address + 2
-
-    def test_instruction_movm_to_i(self, mock_bus: MockBus) -> None:
+    def test_instruction_movm_to_i(self, mock_bus: MockBus, mock_core: MockCore) -> None:
         for x in range(16):
-            values = [randint(0, 255) for _ in range(x + 1)]
-            address = randint(0, 0xF00)
+            values = [_rng.randint(0, 255) for _ in range(x + 1)]
+            address = _rng.randint(0, 0xF00)
 
-            sut = Chip8Core(
-                bus=mock_bus.bus,
-                reserved_address=352,
-                display=MagicMock(spec_set=Display),
-                keyboard=MagicMock(spec_set=Keyboard),
-                entrypoint=0x200,
-                instructions_per_update=16,
-            )
+            sut = mock_core.core
             sut._i = address
             for x2, value in enumerate(values):
                 sut._v[x2] = value
@@ -638,50 +502,15 @@ class TestChip8Core:
             sut._instruction_movm_to_i(x)
 
             assert sut._i == address + x + 1
-            for x2, value in enumerate(values):
-                assert mock_bus.memory[address + x2] == value
+            assert mock_bus.memory[address : address + x + 1] == bytes(values)
 
-    def test_execute_instruction_movm_to_i(self, mock_bus: MockBus) -> None:
-        sut = Chip8Core(
-            bus=mock_bus.bus,
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
-
-        for _ in range(10):
-            address = randint(0, 0xFFE)
-            op = 0xF
-            x = randint(0, 15)
-            nn = 0x55
-
-            sut._pc = address
-            mock_bus.memory[address] = (op << 4) | x
-            mock_bus.memory[address + 1] = nn
-
-            with patch.object(sut, '_instruction_movm_to_i', spec_set=Callable) as mock_instruction:
-                sut._execute_instruction()
-
-                mock_instruction.assert_called_once_with(x)
-                assert sut._pc == address + 2
-
-    def test_instruction_movm_from_i(self, mock_bus: MockBus) -> None:
+    def test_instruction_movm_from_i(self, mock_bus: MockBus, mock_core: MockCore) -> None:
         for x in range(16):
-            values = [randint(0, 255) for _ in range(x + 1)]
-            address = randint(0, 0xF00)
-            for x2, value in enumerate(values):
-                mock_bus.memory[address + x2] = value
+            values = [_rng.randint(0, 255) for _ in range(x + 1)]
+            address = _rng.randint(0, 0xF00)
+            mock_bus.memory[address : address + x + 1] = bytes(values)
 
-            sut = Chip8Core(
-                bus=mock_bus.bus,
-                reserved_address=352,
-                display=MagicMock(spec_set=Display),
-                keyboard=MagicMock(spec_set=Keyboard),
-                entrypoint=0x200,
-                instructions_per_update=16,
-            )
+            sut = mock_core.core
             sut._i = address
 
             sut._instruction_movm_from_i(x)
@@ -690,44 +519,11 @@ class TestChip8Core:
             for x2, value in enumerate(values):
                 assert sut._v[x2] == value
 
-    def test_execute_instruction_movm_from_i(self, mock_bus: MockBus) -> None:
-        sut = Chip8Core(
-            bus=mock_bus.bus,
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
-
+    def test_instruction_mov_imediate(self, mock_core: MockCore) -> None:
         for _ in range(10):
-            address = randint(0, 0xFFE)
-            op = 0xF
-            x = randint(0, 15)
-            nn = 0x65
+            values = [_rng.randint(0, 255) for _ in range(16)]
 
-            sut._pc = address
-            mock_bus.memory[address] = (op << 4) | x
-            mock_bus.memory[address + 1] = nn
-
-            with patch.object(sut, '_instruction_movm_from_i', spec_set=Callable) as mock_instruction:
-                sut._execute_instruction()
-
-                mock_instruction.assert_called_once_with(x)
-                assert sut._pc == address + 2
-
-    def test_instruction_mov_imediate(self) -> None:
-        for _ in range(10):
-            values = [randint(0, 255) for _ in range(16)]
-
-            sut = Chip8Core(
-                bus=MagicMock(spec_set=DeviceBus),
-                reserved_address=352,
-                display=MagicMock(spec_set=Display),
-                keyboard=MagicMock(spec_set=Keyboard),
-                entrypoint=0x200,
-                instructions_per_update=16,
-            )
+            sut = mock_core.core
 
             for x, value in enumerate(values):
                 sut._instruction_mov_imediate(x, value)
@@ -735,44 +531,11 @@ class TestChip8Core:
             for x, value in enumerate(values):
                 assert sut._v[x] == value
 
-    def test_execute_instruction_mov_imediate(self, mock_bus: MockBus) -> None:
-        sut = Chip8Core(
-            bus=mock_bus.bus,
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
-
-        for _ in range(10):
-            address = randint(0, 0xFFE)
-            op = 6
-            x = randint(0, 15)
-            nn = randint(0, 0xFF)
-
-            sut._pc = address
-            mock_bus.memory[address] = (op << 4) | x
-            mock_bus.memory[address + 1] = nn
-
-            with patch.object(sut, '_instruction_mov_imediate', spec_set=Callable) as mock_instruction:
-                sut._execute_instruction()
-
-                mock_instruction.assert_called_once_with(x, nn)
-                assert sut._pc == address + 2
-
-    def test_instruction_mov_register(self) -> None:
-        sut = Chip8Core(
-            bus=MagicMock(spec_set=DeviceBus),
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
+    def test_instruction_mov_register(self, mock_core: MockCore) -> None:
+        sut = mock_core.core
 
         for x in range(16):
-            values = [randint(0, 255) for _ in range(16)]
+            values = [_rng.randint(0, 255) for _ in range(16)]
             for x2, value in enumerate(values):
                 sut._v[x2] = value
 
@@ -781,47 +544,13 @@ class TestChip8Core:
 
                 assert sut._v[x] == sut._v[y]
 
-    def test_execute_instruction_mov_register(self, mock_bus: MockBus) -> None:
-        sut = Chip8Core(
-            bus=mock_bus.bus,
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
-
-        for _ in range(10):
-            address = randint(0, 0xFFE)
-            op = 8
-            x = randint(0, 15)
-            y = randint(0, 15)
-            n = 0
+    def test_instruction_and(self, mock_core: MockCore) -> None:
+        sut = mock_core.core
 
-            sut._pc = address
-            mock_bus.memory[address] = (op << 4) | x
-            mock_bus.memory[address + 1] = (y << 4) | n
-
-            with patch.object(sut, '_instruction_mov_register', spec_set=Callable) as mock_instruction:
-                sut._execute_instruction()
-
-                mock_instruction.assert_called_once_with(x, y)
-                assert sut._pc == address + 2
-
-    def test_instruction_and(self) -> None:
-        sut = Chip8Core(
-            bus=MagicMock(spec_set=DeviceBus),
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
-
-        for x in range(16):
-            values = [randint(0, 255) for _ in range(16)]
-            for x2, value in enumerate(values):
-                sut._v[x2] = value
+        for x in range(16):
+            values = [_rng.randint(0, 255) for _ in range(16)]
+            for x2, value in enumerate(values):
+                sut._v[x2] = value
 
             for y in range(16):
                 sut._v[x] = values[x]
@@ -830,45 +559,11 @@ class TestChip8Core:
 
                 assert sut._v[x] == values[x] & values[y]
 
-    def test_execute_instruction_and(self, mock_bus: MockBus) -> None:
-        sut = Chip8Core(
-            bus=mock_bus.bus,
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
-
-        for _ in range(10):
-            address = randint(0, 0xFFE)
-            op = 8
-            x = randint(0, 15)
-            y = randint(0, 15)
-            n = 2
-
-            sut._pc = address
-            mock_bus.memory[address] = (op << 4) | x
-            mock_bus.memory[address + 1] = (y << 4) | n
-
-            with patch.object(sut, '_instruction_and', spec_set=Callable) as mock_instruction:
-                sut._execute_instruction()
-
-                mock_instruction.assert_called_once_with(x, y)
-                assert sut._pc == address + 2
-
-    def test_instruction_or(self) -> None:
-        sut = Chip8Core(
-            bus=MagicMock(spec_set=DeviceBus),
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
+    def test_instruction_or(self, mock_core: MockCore) -> None:
+        sut = mock_core.core
 
         for x in range(16):
-            values = [randint(0, 255) for _ in range(16)]
+            values = [_rng.randint(0, 255) for _ in range(16)]
             for x2, value in enumerate(values):
                 sut._v[x2] = value
 
@@ -879,45 +574,11 @@ class TestChip8Core:
 
                 assert sut._v[x] == values[x] | values[y]
 
-    def test_execute_instruction_or(self, mock_bus: MockBus) -> None:
-        sut = Chip8Core(
-            bus=mock_bus.bus,
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
-
-        for _ in range(10):
-            address = randint(0, 0xFFE)
-            op = 8
-            x = randint(0, 15)
-            y = randint(0, 15)
-            n = 1
-
-            sut._pc = address
-            mock_bus.memory[address] = (op << 4) | x
-            mock_bus.memory[address + 1] = (y << 4) | n
-
-            with patch.object(sut, '_instruction_or', spec_set=Callable) as mock_instruction:
-                sut._execute_instruction()
-
-                mock_instruction.assert_called_once_with(x, y)
-                assert sut._pc == address + 2
-
-    def test_instruction_xor(self) -> None:
-        sut = Chip8Core(
-            bus=MagicMock(spec_set=DeviceBus),
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
+    def test_instruction_xor(self, mock_core: MockCore) -> None:
+        sut = mock_core.core
 
         for x in range(16):
-            values = [randint(0, 255) for _ in range(16)]
+            values = [_rng.randint(0, 255) for _ in range(16)]
             for x2, value in enumerate(values):
                 sut._v[x2] = value
 
@@ -928,439 +589,198 @@ class TestChip8Core:
 
                 assert sut._v[x] == values[x] ^ values[y]
 
-    def test_execute_instruction_xor(self, mock_bus: MockBus) -> None:
-        sut = Chip8Core(
-            bus=mock_bus.bus,
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
-
-        for _ in range(10):
-            address = randint(0, 0xFFE)
-            op = 8
-            x = randint(0, 15)
-            y = randint(0, 15)
-            n = 3
-
-            sut._pc = address
-            mock_bus.memory[address] = (op << 4) | x
-            mock_bus.memory[address + 1] = (y << 4) | n
+    def test_instruction_add_imediate(self, mock_core: MockCore) -> None:
+        values = [_rng.randint(0, 255) for _ in range(16)]
 
-            with patch.object(sut, '_instruction_xor', spec_set=Callable) as mock_instruction:
-                sut._execute_instruction()
-
-                mock_instruction.assert_called_once_with(x, y)
-                assert sut._pc == address + 2
-
-    def test_instruction_add_imediate(self) -> None:
-        values = [randint(0, 255) for _ in range(16)]
-
-        sut = Chip8Core(
-            bus=MagicMock(spec_set=DeviceBus),
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
+        sut = mock_core.core
 
         for x, value in enumerate(values):
             sut._v[x] = value
-            value2 = randint(0, 255)
+            value2 = _rng.randint(0, 255)
 
             sut._instruction_add_imediate(x, value2)
 
             assert sut._v[x] == (value + value2) & 0xFF
 
-    def test_execute_instruction_add_imediate(self, mock_bus: MockBus) -> None:
-        sut = Chip8Core(
-            bus=mock_bus.bus,
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
-
-        for _ in range(10):
-            address = randint(0, 0xFFE)
-            op = 7
-            x = randint(0, 15)
-            nn = randint(0, 0xFF)
+    @pytest.mark.parametrize(('x', 'y', 'value1', 'value2'), REGISTER_PAIR_CASES)
+    def test_instruction_add_register(self, mock_core: MockCore, x: int, y: int, value1: int, value2: int) -> None:
+        sut = mock_core.core
 
-            sut._pc = address
-            mock_bus.memory[address] = (op << 4) | x
-            mock_bus.memory[address + 1] = nn
+        total = value1 + value2 if x != y else value2 + value2
 
-            with patch.object(sut, '_instruction_add_imediate', spec_set=Callable) as mock_instruction:
-                sut._execute_instruction()
+        sut._v[x] = value1
+        sut._v[y] = value2
 
-                mock_instruction.assert_called_once_with(x, nn)
-                assert sut._pc == address + 2
+        sut._instruction_add_register(x, y)
 
-    def test_instruction_add_register(self) -> None:
-        sut = Chip8Core(
-            bus=MagicMock(spec_set=DeviceBus),
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
+        assert sut._v[x] == total & 0xFF
+        assert sut._v[15] == total >> 8
 
-        for x in range(15):
-            for y in range(15):
-                value1 = randint(0, 255)
-                value2 = randint(0, 255)
-                total = value1 + value2 if x != y else value2 + value2
+    @pytest.mark.parametrize(('x', 'y', 'value1', 'value2'), REGISTER_PAIR_CASES)
+    def test_instruction_sub(self, mock_core: MockCore, x: int, y: int, value1: int, value2: int) -> None:
+        sut = mock_core.core
 
-                sut._v[x] = value1
-                sut._v[y] = value2
+        sut._v[x] = value1
+        sut._v[y] = value2
 
-                sut._instruction_add_register(x, y)
+        sut._instruction_sub(x, y)
 
-                assert sut._v[x] == total & 0xFF
-                assert sut._v[15] == total >> 8
+        assert sut._v[x] == (value1 - value2 if x != y else 0) & 0xFF
+        assert sut._v[15] == int(value1 > value2 if x != y else False)
 
-    def test_execute_instruction_add_register(self, mock_bus: MockBus) -> None:
-        sut = Chip8Core(
-            bus=mock_bus.bus,
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
+    @pytest.mark.parametrize(('x', 'y', 'value1', 'value2'), REGISTER_PAIR_CASES)
+    def test_instruction_subb(self, mock_core: MockCore, x: int, y: int, value1: int, value2: int) -> None:
+        sut = mock_core.core
 
-        for _ in range(10):
-            address = randint(0, 0xFFE)
-            op = 8
-            x = randint(0, 15)
-            y = randint(0, 15)
-            n = 4
+        sut._v[x] = value1
+        sut._v[y] = value2
 
-            sut._pc = address
-            mock_bus.memory[address] = (op << 4) | x
-            mock_bus.memory[address + 1] = (y << 4) | n
+        sut._instruction_subb(x, y)
 
-            with patch.object(sut, '_instruction_add_register', spec_set=Callable) as mock_instruction:
-                sut._execute_instruction()
+        assert sut._v[x] == (value2 - value1 if x != y else 0) & 0xFF
+        assert sut._v[15] == int(value2 > value1 if x != y else False)
 
-                mock_instruction.assert_called_once_with(x, y)
-                assert sut._pc == address + 2
+    @pytest.mark.parametrize(('x', 'y', 'value'), REGISTER_VALUE_CASES)
+    def test_instruction_shr(self, mock_core: MockCore, x: int, y: int, value: int) -> None:
+        sut = mock_core.core
 
-    def test_instruction_sub(self) -> None:
-        sut = Chip8Core(
-            bus=MagicMock(spec_set=DeviceBus),
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
+        sut._v[y] = value
 
-        for x in range(15):
-            for y in range(15):
-                value1 = randint(0, 255)
-                value2 = randint(0, 255)
+        sut._instruction_shr(x, y)
 
-                sut._v[x] = value1
-                sut._v[y] = value2
+        assert sut._v[x] == value >> 1
+        assert sut._v[15] == value & 1
 
-                sut._instruction_sub(x, y)
+    @pytest.mark.parametrize(('x', 'y', 'value'), REGISTER_VALUE_CASES)
+    def test_instruction_shl(self, mock_core: MockCore, x: int, y: int, value: int) -> None:
+        sut = mock_core.core
 
-                assert sut._v[x] == (value1 - value2 if x != y else 0) & 0xFF
-                assert sut._v[15] == int(value1 > value2 if x != y else False)
+        sut._v[y] = value
 
-    def test_execute_instruction_sub(self, mock_bus: MockBus) -> None:
-        sut = Chip8Core(
-            bus=mock_bus.bus,
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
+        sut._instruction_shl(x, y)
 
-        for _ in range(10):
-            address = randint(0, 0xFFE)
-            op = 8
-            x = randint(0, 15)
-            y = randint(0, 15)
-            n = 5
+        assert sut._v[x] == (value << 1) & 0xFF
+        assert sut._v[15] == value >> 7
 
-            sut._pc = address
-            mock_bus.memory[address] = (op << 4) | x
-            mock_bus.memory[address + 1] = (y << 4) | n
+    def test_instruction_sub_with_flag_register(self, mock_core: MockCore) -> None:
+        sut = mock_core.core
 
-            with patch.object(sut, '_instruction_sub', spec_set=Callable) as mock_instruction:
-                sut._execute_instruction()
+        for _ in range(10):
+            value1, value2 = _rng.randbytes(2)
 
-                mock_instruction.assert_called_once_with(x, y)
-                assert sut._pc == address + 2
+            sut._v[15] = value1
+            sut._v[0] = value2
 
-    def test_instruction_subb(self) -> None:
-        sut = Chip8Core(
-            bus=MagicMock(spec_set=DeviceBus),
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
+            sut._instruction_sub(15, 0)
 
-        for x in range(15):
-            for y in range(15):
-                value1 = randint(0, 255)
-                value2 = randint(0, 255)
+            assert sut._v[15] == (value1 - value2) & 0xFF
 
-                sut._v[x] = value1
-                sut._v[y] = value2
+            sut._v[0] = value1
+            sut._v[15] = value2
 
-                sut._instruction_subb(x, y)
+            sut._instruction_sub(0, 15)
 
-                assert sut._v[x] == (value2 - value1 if x != y else 0) & 0xFF
-                assert sut._v[15] == int(value2 > value1 if x != y else False)
+            assert sut._v[0] == (value1 - value2) & 0xFF
+            assert sut._v[15] == int(value1 > value2)
 
-    def test_execute_instruction_subb(self, mock_bus: MockBus) -> None:
-        sut = Chip8Core(
-            bus=mock_bus.bus,
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
+    def test_instruction_subb_with_flag_register(self, mock_core: MockCore) -> None:
+        sut = mock_core.core
 
         for _ in range(10):
-            address = randint(0, 0xFFE)
-            op = 8
-            x = randint(0, 15)
-            y = randint(0, 15)
-            n = 7
+            value1, value2 = _rng.randbytes(2)
 
-            sut._pc = address
-            mock_bus.memory[address] = (op << 4) | x
-            mock_bus.memory[address + 1] = (y << 4) | n
+            sut._v[15] = value1
+            sut._v[0] = value2
 
-            with patch.object(sut, '_instruction_subb', spec_set=Callable) as mock_instruction:
-                sut._execute_instruction()
+            sut._instruction_subb(15, 0)
 
-                mock_instruction.assert_called_once_with(x, y)
-                assert sut._pc == address + 2
+            assert sut._v[15] == (value2 - value1) & 0xFF
 
-    def test_instruction_shr(self) -> None:
-        sut = Chip8Core(
-            bus=MagicMock(spec_set=DeviceBus),
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
+            sut._v[0] = value1
+            sut._v[15] = value2
 
-        for x in range(15):
-            for y in range(15):
-                value = randint(0, 255)
+            sut._instruction_subb(0, 15)
 
-                sut._v[y] = value
+            assert sut._v[0] == (value2 - value1) & 0xFF
+            assert sut._v[15] == int(value2 > value1)
 
-                sut._instruction_shr(x, y)
-
-                assert sut._v[x] == value >> 1
-                assert sut._v[15] == value & 1
-
-    def test_execute_instruction_shr(self, mock_bus: MockBus) -> None:
-        sut = Chip8Core(
-            bus=mock_bus.bus,
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
+    def test_instruction_shr_with_flag_register(self, mock_core: MockCore) -> None:
+        sut = mock_core.core
 
         for _ in range(10):
-            address = randint(0, 0xFFE)
-            op = 8
-            x = randint(0, 15)
-            y = randint(0, 15)
-            n = 6
+            (value,) = _rng.randbytes(1)
 
-            sut._pc = address
-            mock_bus.memory[address] = (op << 4) | x
-            mock_bus.memory[address + 1] = (y << 4) | n
+            sut._v[0] = value
 
-            with patch.object(sut, '_instruction_shr', spec_set=Callable) as mock_instruction:
-                sut._execute_instruction()
+            sut._instruction_shr(15, 0)
 
-                mock_instruction.assert_called_once_with(x, y)
-                assert sut._pc == address + 2
+            assert sut._v[15] == value >> 1
 
-    def test_instruction_shl(self) -> None:
-        sut = Chip8Core(
-            bus=MagicMock(spec_set=DeviceBus),
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
-
-        for x in range(15):
-            for y in range(15):
-                value = randint(0, 255)
+            sut._v[15] = value
 
-                sut._v[y] = value
+            sut._instruction_shr(0, 15)
 
-                sut._instruction_shl(x, y)
+            assert sut._v[0] == value >> 1
+            assert sut._v[15] == value & 1
 
-                assert sut._v[x] == (value << 1) & 0xFF
-                assert sut._v[15] == value >> 7
-
-    def test_execute_instruction_shl(self, mock_bus: MockBus) -> None:
-        sut = Chip8Core(
-            bus=mock_bus.bus,
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
+    def test_instruction_shl_with_flag_register(self, mock_core: MockCore) -> None:
+        sut = mock_core.core
 
         for _ in range(10):
-            address = randint(0, 0xFFE)
-            op = 8
-            x = randint(0, 15)
-            y = randint(0, 15)
-            n = 0xE
+            (value,) = _rng.randbytes(1)
 
-            sut._pc = address
-            mock_bus.memory[address] = (op << 4) | x
-            mock_bus.memory[address + 1] = (y << 4) | n
+            sut._v[0] = value
 
-            with patch.object(sut, '_instruction_shl', spec_set=Callable) as mock_instruction:
-                sut._execute_instruction()
+            sut._instruction_shl(15, 0)
 
-                mock_instruction.assert_called_once_with(x, y)
-                assert sut._pc == address + 2
+            assert sut._v[15] == (value << 1) & 0xFF
 
-    def test_instruction_cls(self) -> None:
-        mock_display = MagicMock(spec_set=Display)
+            sut._v[15] = value
 
-        sut = Chip8Core(
-            bus=MagicMock(spec_set=DeviceBus),
-            reserved_address=352,
-            display=mock_display,
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
+            sut._instruction_shl(0, 15)
 
-        sut._instruction_cls()
+            assert sut._v[0] == (value << 1) & 0xFF
+            assert sut._v[15] == value >> 7
 
-        mock_display.clear.assert_called_once_with()
+    def test_instruction_cls(self, mock_core: MockCore) -> None:
+        sut = mock_core.core
 
-    def test_execute_instruction_cls(self, mock_bus: MockBus) -> None:
-        sut = Chip8Core(
-            bus=mock_bus.bus,
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
-
-        for _ in range(10):
-            address = randint(0, 0xFFE)
-            instruction = 0x00E0
-
-            sut._pc = address
-            mock_bus.memory[address] = instruction >> 8
-            mock_bus.memory[address + 1] = instruction & 0xFF
-
-            with patch.object(sut, '_instruction_cls', spec_set=Callable) as mock_instruction:
-                sut._execute_instruction()
+        sut._instruction_cls()
 
-                mock_instruction.assert_called_once_with()
-                assert sut._pc == address + 2
+        assert mock_core.display.clear_calls == 1
 
-    def test_instruction_sprite(self, mock_bus: MockBus) -> None:
+    def test_instruction_sprite(self, mock_bus: MockBus, mock_core: MockCore) -> None:
         for _ in range(10):
-            x = randint(0, 64)
-            y = randint(0, 32)
-            vx = randint(0, 14)
-            vy = choice([i for i in range(15) if i != vx])
-            n = randint(1, 10)
-            values = [randint(0, 255) for _ in range(n)]
-            address = randint(0, 0xF00)
-            for i, value in enumerate(values):
-                mock_bus.memory[address + i] = value
-            flipped = choice([True, False])
-
-            mock_display = MagicMock(spec_set=Display)
-            mock_display.draw_sprite.return_value = flipped
-
-            sut = Chip8Core(
-                bus=mock_bus.bus,
-                reserved_address=352,
-                display=mock_display,
-                keyboard=MagicMock(spec_set=Keyboard),
-                entrypoint=0x200,
-                instructions_per_update=16,
-            )
+            x = _rng.randint(0, 64)
+            y = _rng.randint(0, 32)
+            vx = _rng.randint(0, 14)
+            vy = _rng.randrange(14)
+            vy += vy >= vx
+            n = _rng.randint(1, 10)
+            values = [_rng.randint(0, 255) for _ in range(n)]
+            address = _rng.randint(0, 0xF00)
+            mock_bus.memory[address : address + n] = bytes(values)
+            flipped = _rng.choice([True, False])
+
+            mock_core.display.draw_calls.clear()
+            mock_core.display.flipped = flipped
+
+            sut = mock_core.core
             sut._i = address
             sut._v[vx] = x
             sut._v[vy] = y
 
             sut._instruction_sprite(vx, vy, n)
 
-            mock_display.draw_sprite.assert_called_once_with(x, y, values)
+            assert mock_core.display.draw_calls == [(x, y, bytes(values))]
             assert sut._v[15] == int(flipped)
 
-    def test_execute_instruction_sprite(self, mock_bus: MockBus) -> None:
-        sut = Chip8Core(
-            bus=mock_bus.bus,
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
-
-        for _ in range(10):
-            address = randint(0, 0xFFE)
-            op = 0xD
-            x = randint(0, 15)
-            y = randint(0, 15)
-            n = randint(0, 0xF)
-
-            sut._pc = address
-            mock_bus.memory[address] = (op << 4) | x
-            mock_bus.memory[address + 1] = (y << 4) | n
-
-            with patch.object(sut, '_instruction_sprite', spec_set=Callable) as mock_instruction:
-                sut._execute_instruction()
-
-                mock_instruction.assert_called_once_with(x, y, n)
-                assert sut._pc == address + 2
-
     @pytest.mark.parametrize('i', range(16))
-    def test_instruction_spritechar(self, i: int) -> None:
-        sut = Chip8Core(
-            bus=MagicMock(spec_set=DeviceBus),
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
+    def test_instruction_spritechar(self, i: int, mock_core: MockCore) -> None:
+        sut = mock_core.core
 
         for _ in range(10):
-            x = randint(0, 15)
+            x = _rng.randint(0, 15)
 
             sut._v[x] = i
 
@@ -1368,88 +788,23 @@ class TestChip8Core:
 
             assert sut._i == i * 5
 
-    def test_execute_instruction_spritechar(self, mock_bus: MockBus) -> None:
-        sut = Chip8Core(
-            bus=mock_bus.bus,
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
-
-        for _ in range(10):
-            address = randint(0, 0xFFE)
-            op = 0xF
-            x = randint(0, 15)
-            nn = 0x29
-
-            sut._pc = address
-            mock_bus.memory[address] = (op << 4) | x
-            mock_bus.memory[address + 1] = nn
-
-            with patch.object(sut, '_instruction_spritechar', spec_set=Callable) as mock_instruction:
-                sut._execute_instruction()
-
-                mock_instruction.assert_called_once_with(x)
-                assert sut._pc == address + 2
-
-    def test_instruction_mov_to_i(self) -> None:
-        sut = Chip8Core(
-            bus=MagicMock(spec_set=DeviceBus),
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
+    def test_instruction_mov_to_i(self, mock_core: MockCore) -> None:
+        sut = mock_core.core
 
         for _ in range(10):
-            address = randint(0, 0xFFF)
+            address = _rng.randint(0, 0xFFF)
 
             sut._instruction_mov_to_i(address)
 
             assert sut._i == address
 
-    def test_execute_instruction_mov_to_i(self, mock_bus: MockBus) -> None:
-        sut = Chip8Core(
-            bus=mock_bus.bus,
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
+    def test_instruction_add_to_i(self, mock_core: MockCore) -> None:
+        sut = mock_core.core
 
         for _ in range(10):
-            address = randint(0, 0xFFE)
-            op = 0xA
-            nnn = randint(0, 0xFFF)
-
-            sut._pc = address
-            mock_bus.memory[address] = (op << 4) | (nnn >> 8)
-            mock_bus.memory[address + 1] = nnn & 0xFF
-
-            with patch.object(sut, '_instruction_mov_to_i', spec_set=Callable) as mock_instruction:
-                sut._execute_instruction()
-
-                mock_instruction.assert_called_once_with(nnn)
-                assert sut._pc == address + 2
-
-    def test_instruction_add_to_i(self) -> None:
-        sut = Chip8Core(
-            bus=MagicMock(spec_set=DeviceBus),
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
-
-        for _ in range(10):
-            i = randint(0, 0xFFF)
-            x = randint(0, 15)
-            value = randint(0, 255)
+            i = _rng.randint(0, 0xFFF)
+            x = _rng.randint(0, 15)
+            value = _rng.randint(0, 255)
 
             sut._i = i
             sut._v[x] = value
@@ -1458,175 +813,75 @@ class TestChip8Core:
 
             assert sut._i == (i + value) & 0xFFF
 
-    def test_execute_instruction_add_to_i(self, mock_bus: MockBus) -> None:
-        sut = Chip8Core(
-            bus=mock_bus.bus,
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
-
-        for _ in range(10):
-            address = randint(0, 0xFFE)
-            op = 0xF
-            x = randint(0, 15)
-            nn = 0x1E
-
-            sut._pc = address
-            mock_bus.memory[address] = (op << 4) | x
-            mock_bus.memory[address + 1] = nn
-
-            with patch.object(sut, '_instruction_add_to_i', spec_set=Callable) as mock_instruction:
-                sut._execute_instruction()
-
-                mock_instruction.assert_called_once_with(x)
-                assert sut._pc == address + 2
-
     @pytest.mark.parametrize('key', Key)
-    def test_instruction_skip_key(self, key: Key) -> None:
+    def test_instruction_skip_key(self, key: Key, mock_core: MockCore) -> None:
         for _ in range(10):
-            address = randint(0, 0xF00)
-            x = randint(0, 15)
+            address = _rng.randint(0, 0xF00)
+            x = _rng.randint(0, 15)
 
-            mock_keyboard = MagicMock(spec_set=Keyboard)
+            mock_keyboard = mock_core.keyboard
 
-            sut = Chip8Core(
-                bus=MagicMock(spec_set=DeviceBus),
-                reserved_address=352,
-                display=MagicMock(spec_set=Display),
-                keyboard=mock_keyboard,
-                entrypoint=0x200,
-                instructions_per_update=16,
-            )
+            sut = mock_core.core
             sut._v[x] = int(key)
 
-            mock_keyboard.__getitem__.return_value = False
+            mock_keyboard.pressed = False
             sut._pc = address
 
             sut._instruction_skip_key(x)
 
             assert sut._pc == address
 
-            mock_keyboard.__getitem__.return_value = True
+            mock_keyboard.pressed = True
             sut._pc = address
 
             sut._instruction_skip_key(x)
 
             assert sut._pc == address + 2
 
-    def test_execute_instruction_skip_key(self, mock_bus: MockBus) -> None:
-        sut = Chip8Core(
-            bus=mock_bus.bus,
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
-
-        for _ in range(10):
-            address = randint(0, 0xFFE)
-            op = 0xE
-            x = randint(0, 15)
-            nn = 0x9E
-
-            sut._pc = address
-            mock_bus.memory[address] = (op << 4) | x
-            mock_bus.memory[address + 1] = nn
-
-            with patch.object(sut, '_instruction_skip_key', spec_set=Callable) as mock_instruction:
-                sut._execute_instruction()
-
-                mock_instruction.assert_called_once_with(x)
-                assert sut._pc == address + 2
-
     @pytest.mark.parametrize('key', Key)
-    def test_instruction_skip_nokey(self, key: Key) -> None:
+    def test_instruction_skip_nokey(self, key: Key, mock_core: MockCore) -> None:
         for _ in range(10):
-            address = randint(0, 0xF00)
-            x = randint(0, 15)
+            address = _rng.randint(0, 0xF00)
+            x = _rng.randint(0, 15)
 
-            mock_keyboard = MagicMock(spec_set=Keyboard)
+            mock_keyboard = mock_core.keyboard
 
-            sut = Chip8Core(
-                bus=MagicMock(spec_set=DeviceBus),
-                reserved_address=352,
-                display=MagicMock(spec_set=Display),
-                keyboard=mock_keyboard,
-                entrypoint=0x200,
-                instructions_per_update=16,
-            )
+            sut = mock_core.core
             sut._v[x] = int(key)
 
-            mock_keyboard.__getitem__.return_value = True
+            mock_keyboard.pressed = True
             sut._pc = address
 
             sut._instruction_skip_nokey(x)
 
             assert sut._pc == address
 
-            mock_keyboard.__getitem__.return_value = False
+            mock_keyboard.pressed = False
             sut._pc = address
 
             sut._instruction_skip_nokey(x)
 
             assert sut._pc == address + 2
 
-    def test_execute_instruction_skip_nokey(self, mock_bus: MockBus) -> None:
-        sut = Chip8Core(
-            bus=mock_bus.bus,
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
-
-        for _ in range(10):
-            address = randint(0, 0xFFE)
-            op = 0xE
-            x = randint(0, 15)
-            nn = 0xA1
-
-            sut._pc = address
-            mock_bus.memory[address] = (op << 4) | x
-            mock_bus.memory[address + 1] = nn
-
-            with patch.object(sut, '_instruction_skip_nokey', spec_set=Callable) as mock_instruction:
-                sut._execute_instruction()
-
-                mock_instruction.assert_called_once_with(x)
-                assert sut._pc == address + 2
-
     @pytest.mark.parametrize('key', Key)
-    def test_instruction_wait_key(self, key: Key) -> None:
+    def test_instruction_wait_key(self, key: Key, mock_core: MockCore) -> None:
         for _ in range(10):
-            address = randint(2, 0xFFF)
-            x = randint(0, 15)
-            future: Future[Key] = Future()
+            address = _rng.randint(2, 0xFFF)
+            x = _rng.randint(0, 15)
 
-            mock_keyboard = MagicMock(spec_set=Keyboard)
-            mock_keyboard.next_key_pressed.return_value = future
+            mock_keyboard = mock_core.keyboard
+            mock_keyboard.first_key = None
 
-            sut = Chip8Core(
-                bus=MagicMock(spec_set=DeviceBus),
-                reserved_address=352,
-                display=MagicMock(spec_set=Display),
-                keyboard=mock_keyboard,
-                entrypoint=0x200,
-                instructions_per_update=16,
-            )
+            sut = mock_core.core
 
-            for _ in range(randint(1, 10)):
+            for _ in range(_rng.randint(1, 10)):
                 sut._pc = address
 
                 sut._instruction_wait_key(x)
 
                 assert sut._pc == address - 2
 
-            future.set_result(key)
+            mock_keyboard.first_key = key
             sut._pc = address
 
             sut._instruction_wait_key(x)
@@ -1634,45 +889,12 @@ class TestChip8Core:
             assert sut._v[x] == key
             assert sut._pc == address
 
-    def test_execute_instruction_wait_key(self, mock_bus: MockBus) -> None:
-        sut = Chip8Core(
-            bus=mock_bus.bus,
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
-
-        for _ in range(10):
-            address = randint(0, 0xFFE)
-            op = 0xF
-            x = randint(0, 15)
-            nn = 0x0A
-
-            sut._pc = address
-            mock_bus.memory[address] = (op << 4) | x
-            mock_bus.memory[address + 1] = nn
-
-            with patch.object(sut, '_instruction_wait_key', spec_set=Callable) as mock_instruction:
-                sut._execute_instruction()
-
-                mock_instruction.assert_called_once_with(x)
-                assert sut._pc == address + 2
-
     @pytest.mark.parametrize('x', range(16))
-    def test_instruction_mov_from_delay(self, x: int) -> None:
-        sut = Chip8Core(
-            bus=MagicMock(spec_set=DeviceBus),
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
+    def test_instruction_mov_from_delay(self, x: int, mock_core: MockCore) -> None:
+        sut = mock_core.core
 
         for _ in range(10):
-            value = randint(0, 255)
+            value = _rng.randint(0, 255)
 
             sut._delay_timer = value
 
@@ -1680,45 +902,12 @@ class TestChip8Core:
 
             assert sut._v[x] == value
 
-    def test_execute_instruction_mov_from_delay(self, mock_bus: MockBus) -> None:
-        sut = Chip8Core(
-            bus=mock_bus.bus,
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
-
-        for _ in range(10):
-            address = randint(0, 0xFFE)
-            op = 0xF
-            x = randint(0, 15)
-            nn = 0x07
-
-            sut._pc = address
-            mock_bus.memory[address] = (op << 4) | x
-            mock_bus.memory[address + 1] = nn
-
-            with patch.object(sut, '_instruction_mov_from_delay', spec_set=Callable) as mock_instruction:
-                sut._execute_instruction()
-
-                mock_instruction.assert_called_once_with(x)
-                assert sut._pc == address + 2
-
     @pytest.mark.parametrize('x', range(16))
-    def test_instruction_mov_to_delay(self, x: int) -> None:
-        sut = Chip8Core(
-            bus=MagicMock(spec_set=DeviceBus),
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
+    def test_instruction_mov_to_delay(self, x: int, mock_core: MockCore) -> None:
+        sut = mock_core.core
 
         for _ in range(10):
-            value = randint(0, 255)
+            value = _rng.randint(0, 255)
 
             sut._v[x] = value
 
@@ -1726,45 +915,12 @@ class TestChip8Core:
 
             assert sut._delay_timer == value
 
-    def test_execute_instruction_mov_to_delay(self, mock_bus: MockBus) -> None:
-        sut = Chip8Core(
-            bus=mock_bus.bus,
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
-
-        for _ in range(10):
-            address = randint(0, 0xFFE)
-            op = 0xF
-            x = randint(0, 15)
-            nn = 0x15
-
-            sut._pc = address
-            mock_bus.memory[address] = (op << 4) | x
-            mock_bus.memory[address + 1] = nn
-
-            with patch.object(sut, '_instruction_mov_to_delay', spec_set=Callable) as mock_instruction:
-                sut._execute_instruction()
-
-                mock_instruction.assert_called_once_with(x)
-                assert sut._pc == address + 2
-
     @pytest.mark.parametrize('x', range(16))
-    def test_instruction_mov_to_sound(self, x: int) -> None:
-        sut = Chip8Core(
-            bus=MagicMock(spec_set=DeviceBus),
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
+    def test_instruction_mov_to_sound(self, x: int, mock_core: MockCore) -> None:
+        sut = mock_core.core
 
         for _ in range(10):
-            value = randint(0, 255)
+            value = _rng.randint(0, 255)
 
             sut._v[x] = value
 
@@ -1772,95 +928,29 @@ class TestChip8Core:
 
             assert sut._sound_timer == value
 
-    def test_execute_instruction_mov_to_sound(self, mock_bus: MockBus) -> None:
-        sut = Chip8Core(
-            bus=mock_bus.bus,
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
-
-        for _ in range(10):
-            address = randint(0, 0xFFE)
-            op = 0xF
-            x = randint(0, 15)
-            nn = 0x18
-
-            sut._pc = address
-            mock_bus.memory[address] = (op << 4) | x
-            mock_bus.memory[address + 1] = nn
-
-            with patch.object(sut, '_instruction_mov_to_sound', spec_set=Callable) as mock_instruction:
-                sut._execute_instruction()
-
-                mock_instruction.assert_called_once_with(x)
-                assert sut._pc == address + 2
-
     @pytest.mark.parametrize('x', range(16))
-    def test_instruction_rnd(self, x: int) -> None:
-        sut = Chip8Core(
-            bus=MagicMock(spec_set=DeviceBus),
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
-
-        for _ in range(10):
-            value = randint(0, 255)
-            nn = randint(0, 255)
-
-            with patch('pychip8.core.randbits', spec_set=Callable) as mock_randbits:
-                mock_randbits.return_value = value
-
-                sut._instruction_rnd(x, nn)
-
-                mock_randbits.assert_called_once_with(8)
-                assert sut._v[x] == value & nn
-
-    def test_execute_instruction_rnd(self, mock_bus: MockBus) -> None:
-        sut = Chip8Core(
-            bus=mock_bus.bus,
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
+    def test_instruction_rnd(self, x: int, mock_core: MockCore, mock_randbits: MagicMock) -> None:
+        sut = mock_core.core
 
         for _ in range(10):
-            address = randint(0, 0xFFE)
-            op = 0xC
-            x = randint(0, 15)
-            nn = randint(0, 0xFF)
+            value = _rng.randint(0, 255)
+            nn = _rng.randint(0, 255)
 
-            sut._pc = address
-            mock_bus.memory[address] = (op << 4) | x
-            mock_bus.memory[address + 1] = nn
+            mock_randbits.reset_mock()
+            mock_randbits.return_value = value
 
-            with patch.object(sut, '_instruction_rnd', spec_set=Callable) as mock_instruction:
-                sut._execute_instruction()
+            sut._instruction_rnd(x, nn)
 
-                mock_instruction.assert_called_once_with(x, nn)
-                assert sut._pc == address + 2
+            mock_randbits.assert_called_once_with(8)
+            assert sut._v[x] == value & nn
 
     @pytest.mark.parametrize('x', range(16))
-    def test_instruction_movbcd(self, mock_bus: MockBus, x: int) -> None:
-        sut = Chip8Core(
-            bus=mock_bus.bus,
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
+    def test_instruction_movbcd(self, mock_bus: MockBus, x: int, mock_core: MockCore) -> None:
+        sut = mock_core.core
 
         for _ in range(10):
-            address = randint(0, 0xF00)
-            value = randint(0, 255)
+            address = _rng.randint(0, 0xF00)
+            value = _rng.randint(0, 255)
 
             sut._i = address
             sut._v[x] = value
@@ -1871,51 +961,79 @@ class TestChip8Core:
             assert mock_bus.memory[address + 1] == value // 10 % 10
             assert mock_bus.memory[address + 2] == value % 10
 
-    def test_execute_instruction_movbcd(self, mock_bus: MockBus) -> None:
-        sut = Chip8Core(
-            bus=mock_bus.bus,
+    @pytest.mark.parametrize(('address', 'x', 'y', 'n', 'nn', 'nnn'), OPERAND_CASES)
+    @pytest.mark.parametrize(('base', 'method', 'fields'), DECODE_CASES)
+    def test_execute_instruction_decode(
+        self,
+        mock_bus: MockBus,
+        mock_core: MockCore,
+        monkeypatch: pytest.MonkeyPatch,
+        base: int,
+        method: str,
+        fields: tuple[str, ...],
+        address: int,
+        x: int,
+        y: int,
+        n: int,
+        nn: int,
+        nnn: int,
+    ) -> None:
+        sut = mock_core.core
+
+        operands = {'x': x, 'y': y, 'n': n, 'nn': nn, 'nnn': nnn}
+        instruction = base
+        for field in fields:
+            instruction |= operands[field] << OPERAND_SHIFTS[field]
+
+        sut._pc = address
+        _write_instruction(mock_bus.memory, address, instruction)
+
+        recorder = Recorder()
+        monkeypatch.setattr(sut, method, recorder)
+
+        sut._execute_instruction()
+
+        assert recorder.calls == [tuple(operands[field] for field in fields)]
+        assert sut._pc == address + 2
+
+    def test_execute_instruction_decoded_cache(self) -> None:
+        bus = DeviceBus()
+        bus.map(0, Ram(size=4096))
+
+        sut = Chip8Core(
+            bus=bus,
             reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
+            display=_mock_display,
+            keyboard=_mock_keyboard,
             entrypoint=0x200,
             instructions_per_update=16,
         )
 
-        for _ in range(10):
-            address = randint(0, 0xFFE)
-            op = 0xF
-            x = randint(0, 15)
-            nn = 0x33
+        bus[0x200] = 0x61
+        bus[0x201] = 0x11
+        sut._execute_instruction()
+        assert sut._v[1] == 0x11
 
-            sut._pc = address
-            mock_bus.memory[address] = (op << 4) | x
-            mock_bus.memory[address + 1] = nn
+        sut._pc = 0x200
+        sut._execute_instruction()
+        assert sut._decoded[0x200] is not None
 
-            with patch.object(sut, '_instruction_movbcd', spec_set=Callable) as mock_instruction:
-                sut._execute_instruction()
+        bus[0x201] = 0x22
+        assert sut._decoded[0x200] is None
 
-                mock_instruction.assert_called_once_with(x)
-                assert sut._pc == address + 2
+        sut._pc = 0x200
+        sut._execute_instruction()
+        assert sut._v[1] == 0x22
 
-    def test_execute_undefined_instruction(self, mock_bus: MockBus) -> None:
-        sut = Chip8Core(
-            bus=mock_bus.bus,
-            reserved_address=352,
-            display=MagicMock(spec_set=Display),
-            keyboard=MagicMock(spec_set=Keyboard),
-            entrypoint=0x200,
-            instructions_per_update=16,
-        )
+    @pytest.mark.parametrize(('address', 'x'), X_CASES)
+    def test_execute_undefined_instruction(self, mock_bus: MockBus, mock_core: MockCore, address: int, x: int) -> None:
+        sut = mock_core.core
 
-        for _ in range(10):
-            address = randint(0, 0xFFE)
-            op = 0xF
-            x = randint(0, 15)
-            nn = randint(0x66, 0xFF)
+        op = 0xF
+        nn = _rng.randint(0x66, 0xFF)
 
-            sut._pc = address
-            mock_bus.memory[address] = (op << 4) | x
-            mock_bus.memory[address + 1] = nn
+        sut._pc = address
+        _write_instruction(mock_bus.memory, address, (op << 12) | (x << 8) | nn)
 
-            with pytest.raises(RuntimeError, match='^Undefined instruction$'):
-                sut._execute_instruction()
+        with pytest.raises(RuntimeError, match='^Undefined instruction$'):
+            sut._execute_instruction()
@@ -1,9 +1,10 @@
-from collections.abc import Callable
 from io import BytesIO
-from random import randint
-from typing import cast
+from os import environ
+from random import Random
 from unittest.mock import MagicMock
 
+import pytest
+
 from pychip8.core import Chip8Core
 from pychip8.cpu import Chip8
 from pychip8.devices.devicebus import DeviceBus
@@ -11,133 +12,200 @@ from pychip8.devices.display import Display
 from pychip8.devices.keyboard import Keyboard
 
 
+class FakeCore(Chip8Core):
+    __slots__ = ('tick_count',)
+
+    def __init__(self) -> None:
+        super().__init__(
+            bus=DeviceBus(),
+            reserved_address=0,
+            display=Display(width=64, height=32),
+            keyboard=Keyboard(),
+            entrypoint=0x200,
+            instructions_per_update=16,
+        )
+        self.tick_count = 0
+
+    def tick(self) -> None:
+        self.tick_count += 1
+
+
+class Counter:
+    __slots__ = ('call_count',)
+
+    def __init__(self) -> None:
+        self.call_count = 0
+
+    def __call__(self) -> None:
+        self.call_count += 1
+
+
+_rng = Random(int(environ.get('PYCHIP8_TEST_SEED', '0')))
+PROGRAMS = [_rng.randbytes(_rng.randint(1, 512)) for _ in range(10)]
+LOAD_AT_CASES = [(_rng.randint(0, 2048), program) for program in PROGRAMS]
+
+_mock_bus = MagicMock(spec_set=DeviceBus)
+_mock_display = MagicMock(spec_set=Display)
+_mock_keyboard = MagicMock(spec_set=Keyboard)
+
+
+@pytest.fixture
+def mock_bus() -> MagicMock:
+    _mock_bus.reset_mock(return_value=True, side_effect=True)
+    return _mock_bus
+
+
+@pytest.fixture
+def mock_display() -> MagicMock:
+    _mock_display.reset_mock(return_value=True, side_effect=True)
+    return _mock_display
+
+
+@pytest.fixture
+def mock_keyboard() -> MagicMock:
+    _mock_keyboard.reset_mock(return_value=True, side_effect=True)
+    return _mock_keyboard
+
+
+@pytest.fixture(scope='class')
+def cores() -> list[FakeCore]:
+    return [FakeCore() for _ in range(10)]
+
+
 class TestChip8:
-    def test_repr(self) -> None:
-        for i in range(10):
-            sut = Chip8(
-                cores=[MagicMock(spec_set=Chip8Core) for _ in range(i)],
-                bus=MagicMock(spec_set=DeviceBus),
-                display=MagicMock(spec_set=Display),
-                keyboard=MagicMock(spec_set=Keyboard),
-                instructions_per_update=16,
-            )
-
-            assert repr(sut) == f'Chip8(cores={i})'
-
-    def test_length(self) -> None:
-        for i in range(10):
-            sut = Chip8(
-                cores=[MagicMock(spec_set=Chip8Core) for _ in range(i)],
-                bus=MagicMock(spec_set=DeviceBus),
-                display=MagicMock(spec_set=Display),
-                keyboard=MagicMock(spec_set=Keyboard),
-                instructions_per_update=16,
-            )
-
-            assert len(sut) == i
-
-    def test_load_program(self) -> None:
-        for _ in range(10):
-            content = [randint(0, 255) for _ in range(randint(1, 512))]
-            program = BytesIO(bytes(content))
-
-            mock_bus = MagicMock(spec_set=DeviceBus)
-
-            sut = Chip8(
-                cores=[MagicMock(spec_set=Chip8Core)],
-                bus=mock_bus,
-                display=MagicMock(spec_set=Display),
-                keyboard=MagicMock(spec_set=Keyboard),
-                instructions_per_update=16,
-            )
+    @pytest.mark.parametrize('i', range(10))
+    def test_repr(
+        self, i: int, cores: list[FakeCore], mock_bus: MagicMock, mock_display: MagicMock, mock_keyboard: MagicMock
+    ) -> None:
+        chip_cores: list[Chip8Core] = list(cores[:i])
+        sut = Chip8(
+            cores=chip_cores,
+            bus=mock_bus,
+            display=mock_display,
+            keyboard=mock_keyboard,
+            instructions_per_update=16,
+        )
+
+        assert repr(sut) == f'Chip8(cores={i})'
+
+    @pytest.mark.parametrize('i', range(10))
+    def test_length(
+        self, i: int, cores: list[FakeCore], mock_bus: MagicMock, mock_display: MagicMock, mock_keyboard: MagicMock
+    ) -> None:
+        chip_cores: list[Chip8Core] = list(cores[:i])
+        sut = Chip8(
+            cores=chip_cores,
+            bus=mock_bus,
+            display=mock_display,
+            keyboard=mock_keyboard,
+            instructions_per_update=16,
+        )
+
+        assert len(sut) == i
+
+    def test_load_program(self, mock_bus: MagicMock, mock_display: MagicMock, mock_keyboard: MagicMock) -> None:
+        sut = Chip8(
+            cores=[FakeCore()],
+            bus=mock_bus,
+            display=mock_display,
+            keyboard=mock_keyboard,
+            instructions_per_update=16,
+        )
 
+        for content in PROGRAMS:
+            program = BytesIO(content)
+
+            mock_bus.reset_mock()
             sut.load_program(program)
 
             mock_bus.load_program.assert_called_once_with(program, 0x200)
 
-    def test_load_program_with_load_at(self) -> None:
-        for _ in range(10):
-            address = randint(0, 2048)
-            content = [randint(0, 255) for _ in range(randint(1, 512))]
-            program = BytesIO(bytes(content))
-
-            mock_bus = MagicMock(spec_set=DeviceBus)
+    def test_load_program_with_load_at(
+        self, mock_bus: MagicMock, mock_display: MagicMock, mock_keyboard: MagicMock
+    ) -> None:
+        sut = Chip8(
+            cores=[FakeCore()],
+            bus=mock_bus,
+            display=mock_display,
+            keyboard=mock_keyboard,
+            instructions_per_update=16,
+        )
 
-            sut = Chip8(
-                cores=[MagicMock(spec_set=Chip8Core)],
-                bus=mock_bus,
-                display=MagicMock(spec_set=Display),
-                keyboard=MagicMock(spec_set=Keyboard),
-                instructions_per_update=16,
-            )
+        for address, content in LOAD_AT_CASES:
+            program = BytesIO(content)
 
+            mock_bus.reset_mock()
             sut.load_program(program, load_at=address)
 
             mock_bus.load_program.assert_called_once_with(program, address)
 
-    def test_tick(self) -> None:
-        for i in range(10):
-            instructions_per_update = randint(1, 16)
-            cores = [MagicMock(spec_set=Chip8Core) for _ in range(i)]
-
-            sut = Chip8(
-                cores=cast(list[Chip8Core], cores),
-                bus=MagicMock(spec_set=DeviceBus),
-                display=MagicMock(spec_set=Display),
-                keyboard=MagicMock(spec_set=Keyboard),
-                instructions_per_update=16,
-            )
+    @pytest.mark.parametrize('i', range(10))
+    def test_tick(
+        self, i: int, cores: list[FakeCore], mock_bus: MagicMock, mock_display: MagicMock, mock_keyboard: MagicMock
+    ) -> None:
+        instructions_per_update = _rng.randint(1, 16)
+        ticking = cores[:i]
+        for core in ticking:
+            core.tick_count = 0
 
-            for j in range(1, instructions_per_update * 3 + 1):
-                sut.tick()
-
-                for core in cores:
-                    assert core.tick.call_count == j
+        chip_cores: list[Chip8Core] = list(ticking)
+        sut = Chip8(
+            cores=chip_cores,
+            bus=mock_bus,
+            display=mock_display,
+            keyboard=mock_keyboard,
+            instructions_per_update=16,
+        )
 
-    def test_callbacks_in_tick(self) -> None:
-        for i in range(10):
-            instructions_per_update = randint(1, 16)
-            cores = [MagicMock(spec_set=Chip8Core) for _ in range(i)]
+        for j in range(1, instructions_per_update * 3 + 1):
+            sut.tick()
 
-            tick_callback = MagicMock(spec_set=Callable)
-            update_callback = MagicMock(spec_set=Callable)
+            assert all(core.tick_count == j for core in ticking)
 
-            sut = Chip8(
-                cores=cast(list[Chip8Core], cores),
-                bus=MagicMock(spec_set=DeviceBus),
-                display=MagicMock(spec_set=Display),
-                keyboard=MagicMock(spec_set=Keyboard),
-                instructions_per_update=instructions_per_update,
-            )
-            sut.set_tick_callback(tick_callback)
-            sut.set_update_callback(update_callback)
+    @pytest.mark.parametrize('i', range(10))
+    def test_callbacks_in_tick(
+        self, i: int, cores: list[FakeCore], mock_bus: MagicMock, mock_display: MagicMock, mock_keyboard: MagicMock
+    ) -> None:
+        instructions_per_update = _rng.randint(1, 16)
+        ticking = cores[:i]
+        for core in ticking:
+            core.tick_count = 0
+        tick_callback = Counter()
+        update_callback = Counter()
 
-            for j in range(1, instructions_per_update * 3 + 1):
-                sut.tick()
+        chip_cores: list[Chip8Core] = list(ticking)
+        sut = Chip8(
+            cores=chip_cores,
+            bus=mock_bus,
+            display=mock_display,
+            keyboard=mock_keyboard,
+            instructions_per_update=instructions_per_update,
+        )
+        sut.set_tick_callback(tick_callback)
+        sut.set_update_callback(update_callback)
 
-                assert tick_callback.call_count == j
-                assert update_callback.call_count == j // instructions_per_update
+        for j in range(1, instructions_per_update * 3 + 1):
+            sut.tick()
 
-    def test_display(self) -> None:
-        mock_display = MagicMock(spec_set=Display)
+            assert tick_callback.call_count == j
+            assert update_callback.call_count == j // instructions_per_update
 
+    def test_display(self, mock_bus: MagicMock, mock_display: MagicMock, mock_keyboard: MagicMock) -> None:
         sut = Chip8(
-            cores=[MagicMock(spec_set=Chip8Core)],
-            bus=MagicMock(spec_set=DeviceBus),
+            cores=[FakeCore()],
+            bus=mock_bus,
             display=mock_display,
-            keyboard=MagicMock(spec_set=Keyboard),
+            keyboard=mock_keyboard,
             instructions_per_update=16,
         )
 
         assert sut.display is mock_display
 
-    def test_keyboard(self) -> None:
-        mock_keyboard = MagicMock(spec_set=Keyboard)
-
+    def test_keyboard(self, mock_bus: MagicMock, mock_display: MagicMock, mock_keyboard: MagicMock) -> None:
         sut = Chip8(
-            cores=[MagicMock(spec_set=Chip8Core)],
-            bus=MagicMock(spec_set=DeviceBus),
-            display=MagicMock(spec_set=Display),
+            cores=[FakeCore()],
+            bus=mock_bus,
+            display=mock_display,
             keyboard=mock_keyboard,
             instructions_per_update=16,
         )